@@ -31,6 +31,10 @@ class AppConfiguration:
     EXTERNAL_API_URL_GSTIN = os.getenv("EXTERNAL_API_URL_GSTIN")
     MONGO_URI = os.environ["MONGO_URI"]
     MAIN_DB = os.getenv("MAIN_DB", "kyc_fabric_db")
+    MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", 200))
+    MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", 20))
+    EXTERNAL_API_POOL_MAXSIZE = int(os.getenv("EXTERNAL_API_POOL_MAXSIZE", 50))
+    THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", 100))
     SECRET_KEY: str = os.getenv("SECRET_KEY", "YOUR_SECRET_KEY_HERE")  # Change in production!
     REFRESH_SECRET_KEY: str = os.getenv("SECRET_KEY", "YOUR_REFRESH_SECRET_KEY_HERE")
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
@@ -157,3 +161,4 @@ class KYCProvider(BaseEnum):
 class RazorpayConfiguration:
     RAZORPAY_KEY_ID: str = os.getenv("RAZORPAY_KEY_ID", "")
     RAZORPAY_KEY_SECRET: str = os.getenv("RAZORPAY_KEY_SECRET", "")
+    RAZORPAY_WEBHOOK_SECRET: str = os.getenv("RAZORPAY_WEBHOOK_SECRET", "")
@@ -1,3 +1,6 @@
+# Standard library imports
+from typing import Optional
+
 # Third-party library imports
 from fastapi import HTTPException, status
 
@@ -44,3 +47,21 @@ class OTPVerificationError(HTTPException):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=detail,
         )
+
+
+class TooManyRequestsException(HTTPException):
+    def __init__(self, retry_after: int):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please try again later",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class PaymentVerificationError(HTTPException):
+    def __init__(self, detail: str = "Payment verification failed", order_id: Optional[str] = None):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail,
+        )
+        self.order_id = order_id
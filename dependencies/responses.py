@@ -0,0 +1,170 @@
+# Standard library imports
+import inspect
+from decimal import Decimal
+from functools import wraps
+from typing import Any
+
+# Third-party library imports
+import orjson
+from bson import Decimal128, ObjectId
+from fastapi import status
+from fastapi.responses import ORJSONResponse, Response
+
+# Local application imports
+from dependencies.logger import logger
+from dependencies.exceptions import InsufficientCreditsException
+
+from dto.common_dto import SuccessPayload
+
+_OK = status.HTTP_200_OK
+_PARTIAL_CONTENT = status.HTTP_206_PARTIAL_CONTENT
+# Pre-serialized failure body; only the status code and the error are filled in per response
+_FAILURE_BODY_TEMPLATE = b'{"http_status_code":%d,"message":"Failure","error":%b}'
+
+
+def _orjson_default(obj: Any) -> Any:
+    """
+    Serialize the Mongo/BSON types orjson does not handle natively.
+
+    Args:
+        obj: The object orjson could not serialize
+
+    Returns:
+        Any: A JSON-serializable representation of the object
+
+    Raises:
+        TypeError: If the object type is not supported
+    """
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, Decimal128):
+        return float(obj.to_decimal())
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class APIJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also serializes ObjectId and Decimal values from Mongo documents."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+def _failure_payload(http_status_code: int, error: Any) -> dict:
+    """
+    Build the failure body shared by all KYC endpoints.
+
+    Args:
+        http_status_code: HTTP status code returned by the handler
+        error: Error message from the handler
+
+    Returns:
+        dict: Failure body with the common error schema
+    """
+    return {"http_status_code": http_status_code, "message": "Failure", "error": error}
+
+
+def _failure_response(http_status_code: int, error: Any) -> Response:
+    """
+    Build the failure response of a KYC endpoint from the pre-serialized template.
+
+    Args:
+        http_status_code: HTTP status code returned by the handler
+        error: Error message from the handler
+
+    Returns:
+        Response: JSON response with the same body as _failure_payload
+    """
+    return Response(
+        content=_FAILURE_BODY_TEMPLATE % (http_status_code, orjson.dumps(error, default=_orjson_default)),
+        status_code=http_status_code,
+        media_type="application/json"
+    )
+
+
+def kyc_payload(
+    service_name: str,
+    verification_response: dict,
+    http_status_code: int,
+    allow_partial_content: bool = False
+) -> dict:
+    """
+    Build the API body for a handler's KYC verification response.
+
+    Args:
+        service_name: Service label used in the success message, e.g. "PAN"
+        verification_response: Verification response returned by the handler
+        http_status_code: HTTP status code returned by the handler
+        allow_partial_content: Whether a 206 from the handler is a successful partial result
+
+    Returns:
+        dict: Success body for 200 (and 206 when allowed), failure body otherwise
+    """
+    if http_status_code == _OK:
+        result = verification_response
+    elif allow_partial_content and http_status_code == _PARTIAL_CONTENT:
+        result = verification_response.get('message')
+    else:
+        return _failure_payload(http_status_code, verification_response.get('message'))
+
+    payload: SuccessPayload = {
+        "http_status_code": http_status_code,
+        "message": f"{service_name} Verification Successful",
+        "result": result
+    }
+    return payload
+
+
+def kyc_response(service_name: str, allow_partial_content: bool = False):
+    """
+    Turn a KYC endpoint returning a handler's (response, http_status_code) tuple into an API response.
+
+    The wrapped endpoint only calls its handler; building the success/failure
+    payloads and mapping unexpected exceptions to 400 responses happens here once
+    for every KYC endpoint. InsufficientCreditsException is left to the app-level
+    exception handler.
+
+    Args:
+        service_name: Service label used in the success message and logs, e.g. "PAN"
+        allow_partial_content: Whether a 206 from the handler is a successful partial result
+
+    Returns:
+        Callable: Decorator for async KYC endpoint functions
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> APIJSONResponse:
+            try:
+                verification_response, http_status_code = await func(*args, **kwargs)
+                # KYC payloads are PII-heavy; keep them out of INFO and format lazily
+                logger.debug("%s Verification Response: %s", service_name, verification_response)
+
+                if http_status_code == _OK or (allow_partial_content and http_status_code == _PARTIAL_CONTENT):
+                    return APIJSONResponse(
+                        status_code=http_status_code,
+                        content=kyc_payload(
+                            service_name, verification_response, http_status_code, allow_partial_content
+                        )
+                    )
+                return _failure_response(http_status_code, verification_response.get('message'))
+            except InsufficientCreditsException:
+                # Rendered as 402 by the app-level handler registered in main
+                raise
+            except Exception as e:
+                logger.error(f"Error in {func.__name__}: {str(e)}")
+                return APIJSONResponse(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    content={"message": str(e)}
+                )
+
+        # FastAPI reads the endpoint signature through __wrapped__; expose the
+        # response class as the return type so it is not taken as a response model
+        wrapper.__signature__ = inspect.signature(func).replace(return_annotation=APIJSONResponse)
+        return wrapper
+
+    return decorator
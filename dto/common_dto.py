@@ -1,4 +1,4 @@
-from typing import Optional, Any
+from typing import Optional, Any, TypedDict
 from pydantic import BaseModel, Field
 
 
@@ -10,3 +10,10 @@ class APISuccessResponse(BaseModel):
 
     class Config:
         exclude_none = True
+
+
+class SuccessPayload(TypedDict):
+    """Success body built on hot response paths; same shape as APISuccessResponse without validation."""
+    http_status_code: int
+    message: str
+    result: Any
@@ -1,3 +1,6 @@
+# Standard library imports
+import re
+
 # Third-party library imports
 from pydantic import BaseModel, Field, field_validator, model_validator
 from typing import Optional
@@ -5,10 +8,23 @@ from typing import Optional
 # Local application imports
 from dependencies.date_utils import convert_to_dd_mm_yyyy, convert_to_yyyy_mm_dd
 
+# Five letters, four digits and a check letter
+_PAN_RE = re.compile(r"[A-Z]{5}[0-9]{4}[A-Z]")
+
 
 class PanVerificationRequest(BaseModel):
     pan: str = Field(..., description="PAN Number to validate")
 
+    @field_validator("pan")
+    def validate_pan(cls, value: str) -> str:
+        """
+        Normalize the PAN to uppercase and reject malformed numbers before verification.
+        """
+        value = value.strip().upper()
+        if not _PAN_RE.fullmatch(value):
+            raise ValueError("Invalid PAN format")
+        return value
+
 
 class VehicleVerificationRequest(BaseModel):
     reg_no: str = Field(..., description="Vehicle Registration Number to validate")
@@ -82,3 +98,25 @@ class EmploymentLatestVerificationRequest(BaseModel):
 
 class GSTINVerificationRequest(BaseModel):
     gstin: str = Field(..., description="GSTIN Number to validate")
+
+
+class BatchVerificationRequest(BaseModel):
+    pan: Optional[PanVerificationRequest] = Field(None, description="PAN verification request")
+    rc: Optional[VehicleVerificationRequest] = Field(None, description="RC verification request")
+    voter: Optional[VoterVerificationRequest] = Field(None, description="Voter verification request")
+    dl: Optional[DLVerificationRequest] = Field(None, description="DL verification request")
+    passport: Optional[PassportVerificationRequest] = Field(None, description="Passport verification request")
+    aadhaar: Optional[AadhaarVerificationRequest] = Field(None, description="Aadhaar verification request")
+    mobile_lookup: Optional[MobileLookupVerificationRequest] = Field(
+        None, description="Mobile lookup verification request")
+    email_lookup: Optional[EmailLookupVerificationRequest] = Field(
+        None, description="Email lookup verification request")
+    employment_latest: Optional[EmploymentLatestVerificationRequest] = Field(
+        None, description="Employment latest verification request")
+    gstin: Optional[GSTINVerificationRequest] = Field(None, description="GSTIN verification request")
+
+    @model_validator(mode="after")
+    def check_at_least_one_verification_provided(cls, values):
+        if all(getattr(values, field) is None for field in cls.model_fields):
+            raise ValueError("At least one verification must be provided in the request")
+        return values
@@ -28,6 +28,11 @@ class UserCreate(UserBase):
     last_name: str
 
 
+class VerifiedUserCreate(UserCreate):
+    """DTO for user creation that also verifies the email OTP."""
+    otp: str
+
+
 class UserUpdate(UserBase):
     """DTO for user updates."""
     password: Optional[str] = None
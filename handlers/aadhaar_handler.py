@@ -36,7 +36,7 @@ class AadhaarHandler:
             dict: Aadhaar verification details
         """
         # Check if user has sufficient credits
-        if self.user_repository.get_user_by_id(user_id).credits < ServicePricing.KYC_AADHAAR_COST:
+        if self.user_repository.get_user_credits(user_id) < ServicePricing.KYC_AADHAAR_COST:
             logger.error(f"User {user_id} has insufficient credits to verify Aadhaar {aadhaar}")
             raise InsufficientCreditsException()
 
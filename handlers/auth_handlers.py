@@ -1,14 +1,17 @@
 # Standard library imports
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import secrets
 import base64
+import hashlib
+import time
+from threading import RLock
 from typing import Any, Optional, Union, Tuple, Dict
 import random
 
 # Third-party library imports
-from fastapi import Depends, HTTPException, status, security, Header
+from cachetools import TTLCache
+from fastapi import BackgroundTasks, Depends, HTTPException, status, security, Header
 from jose import jwt, JWTError
-from mongoengine.errors import DoesNotExist
 
 # Local application imports
 from dependencies.logger import logger
@@ -19,6 +22,7 @@ from dependencies.exceptions import (
     UserNotFoundException,
     UserAlreadyExistsException,
     OTPVerificationError,
+    TooManyRequestsException,
     INVALID_REFRESH_TOKEN_MSG
 )
 from dependencies.constants import IST
@@ -26,6 +30,7 @@ from dependencies.constants import IST
 from dto.user_dto import (
     TokenPayload,
     UserCreate,
+    VerifiedUserCreate,
     UserUpdate,
     Token,
     TokenRefresh,
@@ -38,10 +43,23 @@ from repositories.api_client_repository import APIClientRepository
 from repositories.verified_user_information_repository import VerifiedUserInformationRepository
 
 from models.user_model import User as UserModel, RefreshToken
-from models.api_client_model import APIClient as APIClientModel
 
 from services.email_service import EmailService
 
+# Authenticated API client users keyed by a hash of the Authorization header,
+# so repeated calls with the same credentials skip Mongo for a short window
+_API_CLIENT_CACHE_TTL_SECONDS = 60
+_api_client_cache = TTLCache(maxsize=50_000, ttl=_API_CLIENT_CACHE_TTL_SECONDS)
+_api_client_cache_lock = RLock()
+
+# Fixed-window limits for the unauthenticated OTP endpoints, counted in Mongo so
+# they hold across workers: (max attempts, window seconds)
+_OTP_RATE_LIMITS = {
+    "send_email": (5, 60),
+    "send_ip": (20, 60),
+    "verify_email": (10, 3600),
+}
+
 
 class AuthHandler:
     oauth2_scheme = security.OAuth2PasswordBearer(tokenUrl="/dashboard/api/v1/auth/login")
@@ -71,19 +89,23 @@ class AuthHandler:
             logger.exception("Error decoding token")
             raise CredentialsException()
 
-        try:
-            user = UserModel.objects.get(id=token_data.sub)
-        except DoesNotExist:
-            logger.exception("User not found")
+        # Served from the repository's short-lived user cache, which is
+        # invalidated on every user write made through the repository
+        user = UserRepository.get_user_by_id(token_data.sub)
+        if user is None:
+            logger.error("User not found")
             raise UserNotFoundException()
 
         return user
 
     @staticmethod
-    def get_current_active_user(current_user: UserModel = Depends(get_current_user)) -> UserModel:
+    async def get_current_active_user(current_user: UserModel = Depends(get_current_user)) -> UserModel:
         """
         Retrieve the current authenticated user if they are active.
 
+        Declared async since it does no I/O, so FastAPI runs it on the event loop
+        instead of dispatching it to the threadpool on every authenticated request.
+
         Args:
             current_user: The authenticated user.
 
@@ -98,28 +120,6 @@ class AuthHandler:
             raise HTTPException(status_code=400, detail="Inactive user")
         return current_user
 
-    @staticmethod
-    def get_current_admin_user(current_user: UserModel = Depends(get_current_active_user)) -> UserModel:
-        """
-        Retrieve the current authenticated user if they are an admin.
-
-        Args:
-            current_user: The authenticated user.
-
-        Returns:
-            UserModel: The admin user.
-
-        Raises:
-            HTTPException: If the user does not have admin privileges.
-        """
-        if current_user.role != "admin":
-            logger.exception("Not enough permissions")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not enough permissions"
-            )
-        return current_user
-
     @staticmethod
     def create_access_token(subject: Union[str, Any], expires_delta: Optional[timedelta] = None) -> str:
         """
@@ -346,8 +346,49 @@ class AuthHandler:
                 detail="Email is not verified. Please verify your email first.",
             )
 
-        # Check for existing email
+        AuthHandler.__check_user_available(user_data)
+        return AuthHandler.__create_user(user_data)
 
+    @staticmethod
+    def register_verified_user(user_data: VerifiedUserCreate) -> User:
+        """
+        Verify a user's email OTP and register them in a single call.
+
+        The availability checks run before the OTP is consumed, so a rejected
+        registration leaves the OTP usable.
+
+        Args:
+            user_data: The user creation request with the OTP sent to the user's email.
+
+        Returns:
+            User: Details of the newly registered user.
+
+        Raises:
+            UserAlreadyExistsException: If a user with the same email already exists.
+            HTTPException: If the username or phone number is already registered.
+            OTPVerificationError: If the OTP does not match the email.
+        """
+        AuthHandler.__check_user_available(user_data)
+
+        if not VerifiedUserInformationRepository.mark_email_verified(user_data.email, user_data.otp):
+            logger.error(f"Invalid OTP or no user found for email: {user_data.email}")
+            raise OTPVerificationError("Invalid OTP")
+
+        return AuthHandler.__create_user(user_data)
+
+    @staticmethod
+    def __check_user_available(user_data: UserCreate) -> None:
+        """
+        Check that no user holds the email, username or phone number of a registration.
+
+        Args:
+            user_data: The user creation request.
+
+        Raises:
+            UserAlreadyExistsException: If a user with the same email already exists.
+            HTTPException: If the username or phone number is already registered.
+        """
+        # Check for existing email
         if UserRepository.get_user_by_email(user_data.email):
             logger.info("User with this email already exists")
             raise UserAlreadyExistsException()
@@ -367,6 +408,17 @@ class AuthHandler:
                 detail="Phone number already registered",
             )
 
+    @staticmethod
+    def __create_user(user_data: UserCreate) -> User:
+        """
+        Create a user and build the registration response.
+
+        Args:
+            user_data: The user creation request.
+
+        Returns:
+            User: Details of the newly registered user.
+        """
         user = UserRepository.create_user(user_data)
         return User(
             _id=str(user.id),
@@ -453,7 +505,7 @@ class AuthHandler:
             client_id, client_secret = credentials.split(":")
 
             # Get API client
-            api_client = APIClientModel.objects.get(client_id=client_id)
+            api_client = APIClientRepository.get_api_client_credentials(client_id)
             if not api_client:
                 logger.error("API client not found")
                 raise CredentialsException()
@@ -468,8 +520,8 @@ class AuthHandler:
                 logger.error("API client is disabled")
                 raise CredentialsException()
 
-            # Get associated user
-            user = APIClientRepository.get_api_client(client_id)
+            # Get associated user, loading only what the API routes read
+            user = UserRepository.get_user_for_auth(api_client.user_id)
             if not user:
                 logger.error("Associated user not found")
                 raise CredentialsException()
@@ -493,7 +545,17 @@ class AuthHandler:
         Raises:
             HTTPException: If the authorization header is invalid.
         """
-        return AuthHandler.get_current_client(authorization)
+        cache_key = hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+        with _api_client_cache_lock:
+            user = _api_client_cache.get(cache_key)
+        if user is not None:
+            return user
+
+        # Only successful authentications are cached
+        user = AuthHandler.get_current_client(authorization)
+        with _api_client_cache_lock:
+            _api_client_cache[cache_key] = user
+        return user
 
     @staticmethod
     def generate_otp():
@@ -506,13 +568,17 @@ class AuthHandler:
         return str(random.randint(100000, 999999))
 
     @staticmethod
-    def send_otp(email: str, phone_number: str):
+    def send_otp(email: str, phone_number: str, background_tasks: Optional[BackgroundTasks] = None):
         """
         Send OTP to a user's email for verification.
 
+        The existence checks and the OTP upsert always run inline; when
+        background tasks are given, only the email is sent after the response.
+
         Args:
             email (str): The user's email address to send the OTP to
             phone_number (str): The user's phone number for record keeping
+            background_tasks (Optional[BackgroundTasks]): Tasks to queue the email on
 
         Raises:
             Exception: If there's an error sending the email or saving to database
@@ -527,31 +593,62 @@ class AuthHandler:
             raise UserAlreadyExistsException()
 
         otp = AuthHandler.generate_otp()
-        verified_user_information_repository = VerifiedUserInformationRepository()
-        verified_user_information_obj = verified_user_information_repository.get_user_by_email_or_phone_number(
-            email, phone_number
-        )
-        if verified_user_information_obj:
-            verified_user_information_obj.otp = otp
-            verified_user_information_obj.is_email_verified = False
-            verified_user_information_obj.save()
+        VerifiedUserInformationRepository.upsert_user_otp(email, phone_number, otp)
+
+        if background_tasks is None:
+            EmailService.send_otp_email(email, otp)
         else:
-            verified_user_information_repository.create_verified_user_information(
-                email, phone_number, otp
+            background_tasks.add_task(AuthHandler.__send_otp_email, email, otp)
+
+    @staticmethod
+    def __send_otp_email(email: str, otp: str) -> None:
+        """Send the OTP email, logging failures since no caller is left to report them to."""
+        try:
+            EmailService.send_otp_email(email, otp)
+        except Exception as e:
+            logger.exception(f"Error sending OTP email to {email}: {str(e)}")
+
+    @staticmethod
+    def check_otp_rate_limit(scope: str, subject: str) -> None:
+        """
+        Count an OTP endpoint attempt and reject it once the window's budget is spent.
+
+        Counters are shared by all workers through Mongo. Subjects are compared
+        case-insensitively, so changing the case of an email does not reset its
+        budget. The limit is best-effort: if the counter cannot be updated the
+        attempt is let through rather than failing the request.
+
+        Args:
+            scope (str): The limit to apply, one of "send_email", "send_ip" or "verify_email"
+            subject (str): The email address or client IP the attempt is counted against
+
+        Raises:
+            TooManyRequestsException: If the subject has exhausted its attempts in the current window
+        """
+        max_attempts, window_seconds = _OTP_RATE_LIMITS[scope]
+        subject = subject.lower()
+        now = int(time.time())
+        window = now // window_seconds
+        try:
+            attempts = VerifiedUserInformationRepository.increment_otp_attempts(
+                f"{scope}:{subject}:{window}",
+                datetime.fromtimestamp((window + 1) * window_seconds, timezone.utc)
             )
+        except Exception as e:
+            logger.exception(f"Error counting OTP attempt {scope} for {subject}: {str(e)}")
+            return
 
-        EmailService.send_otp_email(email, otp)
+        if attempts > max_attempts:
+            logger.warning(f"OTP rate limit {scope} exceeded for {subject}")
+            raise TooManyRequestsException(retry_after=window_seconds - now % window_seconds)
 
     @staticmethod
     def verify_otp(email: str, otp: str):
         """
         Verify a user's OTP and mark their email as verified if correct.
 
-        This function:
-        1. Retrieves the user's stored OTP
-        2. Compares it with the provided OTP
-        3. If matched, marks the email as verified
-        4. Returns success/failure status
+        The OTP comparison and the verification flag update happen in a single
+        conditional update on the stored record.
 
         Args:
             email (str): The user's email address to verify
@@ -570,21 +667,11 @@ class AuthHandler:
                 logger.error("Email or OTP is empty")
                 raise ValueError("Email and OTP are required")
 
-            # Get user information from repository
-            verified_user_information_obj = VerifiedUserInformationRepository.find_user_by_email(email)
-            if not verified_user_information_obj:
-                logger.error(f"No user found with email: {email}")
+            # Match on email and OTP and mark the email as verified in one step
+            if not VerifiedUserInformationRepository.mark_email_verified(email, otp):
+                logger.error(f"Invalid OTP or no user found for email: {email}")
                 return False
 
-            # Verify OTP
-            if verified_user_information_obj.otp != otp:
-                logger.error(f"Invalid OTP for email: {email}")
-                return False
-
-            # Mark email as verified
-            verified_user_information_obj.is_email_verified = True
-            verified_user_information_obj.save()
-
             logger.info(f"Successfully verified email: {email}")
             return True
 
@@ -650,7 +737,34 @@ class AuthHandler:
 
             user.hashed_password = PasswordUtils.get_password_hash(password)
             user.save()
+            UserRepository.invalidate_user_cache(user.id)
             return True
         except Exception as e:
             logger.exception(f"Error resetting password for email {email}: {str(e)}")
             return False
+
+
+# Declared after the class so it can depend on AuthHandler.get_current_active_user,
+# the same callable the routes depend on
+async def get_current_admin_user(
+    current_user: UserModel = Depends(AuthHandler.get_current_active_user)
+) -> UserModel:
+    """
+    Retrieve the current authenticated user if they are an admin.
+
+    Args:
+        current_user: The authenticated user.
+
+    Returns:
+        UserModel: The admin user.
+
+    Raises:
+        HTTPException: If the user does not have admin privileges.
+    """
+    if current_user.role != "admin":
+        logger.exception("Not enough permissions")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+    return current_user
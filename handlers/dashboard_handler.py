@@ -1,6 +1,8 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 from decimal import Decimal
 
+from fastapi import BackgroundTasks
+
 from repositories.user_ledger_transaction_repository import UserLedgerTransactionRepository
 from repositories.user_repository import UserRepository
 
@@ -38,8 +40,7 @@ class DashboardHandler:
         Returns:
             float: Total pending credits amount
         """
-        user_obj = self.user_repository.get_user_by_id(user_id)
-        return user_obj.credits
+        return self.user_repository.get_user_credits(user_id)
 
     def get_user_weekly_statistics(self, user_id: str, service_name: str) -> List[Dict]:
         """
@@ -148,7 +149,15 @@ class DashboardHandler:
             logger.error(f"Error getting monthly statistics for user {user_id}: {str(e)}")
             raise
 
-    def capture_contact_us_lead(self, name: str, lead_email: str, company: str, phone: str, message: str) -> bool:
+    def capture_contact_us_lead(
+        self,
+        name: str,
+        lead_email: str,
+        company: str,
+        phone: str,
+        message: str,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> bool:
         """
         Capture and process a contact us form submission.
 
@@ -158,6 +167,7 @@ class DashboardHandler:
             company: Company name
             phone: Contact phone number
             message: Inquiry or message from the lead
+            background_tasks: Tasks to queue the notification email on; sent inline if omitted
 
         Returns:
             bool: True if the lead was successfully captured and processed, False otherwise
@@ -172,6 +182,14 @@ class DashboardHandler:
                 logger.error("Missing required fields in contact us form")
                 raise ValueError("All fields are required")
 
+            if background_tasks is not None:
+                # Send the notification email once the response has gone out
+                background_tasks.add_task(
+                    DashboardHandler.__send_contact_us_lead_email, name, lead_email, company, phone, message
+                )
+                logger.info(f"Queued contact us lead notification for {lead_email}")
+                return True
+
             # Send notification email
             EmailService.send_contact_us_lead_email(name, lead_email, company, phone, message)
 
@@ -181,3 +199,11 @@ class DashboardHandler:
         except Exception as e:
             logger.exception(f"Error processing contact us lead: {str(e)}")
             return False
+
+    @staticmethod
+    def __send_contact_us_lead_email(name: str, lead_email: str, company: str, phone: str, message: str) -> None:
+        """Send the contact us lead email, logging failures since no caller is left to report them to."""
+        try:
+            EmailService.send_contact_us_lead_email(name, lead_email, company, phone, message)
+        except Exception as e:
+            logger.exception(f"Error sending contact us lead email for {lead_email}: {str(e)}")
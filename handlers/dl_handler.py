@@ -37,7 +37,7 @@ class DLHandler:
             dict: DL verification details
         """
         # Check if user has sufficient credits
-        if self.user_repository.get_user_by_id(user_id).credits < ServicePricing.KYC_DL_COST:
+        if self.user_repository.get_user_credits(user_id) < ServicePricing.KYC_DL_COST:
             logger.error(f"User {user_id} has insufficient credits to verify DL {dl_no}")
             raise InsufficientCreditsException()
 
@@ -44,7 +44,7 @@ class EmploymentLatestHandler:
             dict: Employment Latest verification details
         """
         # Check if user has sufficient credits
-        if self.user_repository.get_user_by_id(user_id).credits < ServicePricing.EV_EMPLOYMENT_LATEST_COST:
+        if self.user_repository.get_user_credits(user_id) < ServicePricing.EV_EMPLOYMENT_LATEST_COST:
             logger.error(
                 f"User {user_id} has insufficient credits to verify Employment Latest "
                 f"{uan} {pan} {mobile} {dob} {employer_name} {employee_name}")
@@ -37,7 +37,7 @@ class GSTINHandler:
             dict: GSTIN verification details
         """
         # Check if user has sufficient credits
-        if self.user_repository.get_user_by_id(user_id).credits < ServicePricing.KYB_GSTIN_COST:
+        if self.user_repository.get_user_credits(user_id) < ServicePricing.KYB_GSTIN_COST:
             logger.error(f"User {user_id} has insufficient credits to verify GSTIN {gstin}")
             raise InsufficientCreditsException()
 
@@ -36,7 +36,7 @@ class MobileLookupHandler:
             dict: Mobile Lookup verification details
         """
         # Check if user has sufficient credits
-        if self.user_repository.get_user_by_id(user_id).credits < ServicePricing.KYC_MOBILE_LOOKUP_COST:
+        if self.user_repository.get_user_credits(user_id) < ServicePricing.KYC_MOBILE_LOOKUP_COST:
             logger.error(f"User {user_id} has insufficient credits to verify mobile {mobile}")
             raise InsufficientCreditsException()
 
@@ -16,6 +16,19 @@ from repositories.kyc_repository import KYCRepository
 
 from services.aitan_services import PanService
 
+# Verification status by the provider's status_code on an HTTP 200 response
+_STATUS_BY_PROVIDER_STATUS_CODE = {
+    100: "FOUND",
+    101: "FOUND",
+    102: "NOT_FOUND",
+}
+
+# Verification status by the HTTP status code of a non-200 response
+_STATUS_BY_HTTP_STATUS_CODE = {
+    400: "BAD_REQUEST",
+    503: "SOURCE_DOWN",
+}
+
 
 class PanHandler:
 
@@ -36,7 +49,7 @@ class PanHandler:
             dict: PAN verification details
         """
         # Check if user has sufficient credits
-        if self.user_repository.get_user_by_id(user_id).credits < ServicePricing.KYC_PAN_COST:
+        if self.user_repository.get_user_credits(user_id) < ServicePricing.KYC_PAN_COST:
             logger.error(f"User {user_id} has insufficient credits to verify PAN {pan}")
             raise InsufficientCreditsException()
 
@@ -150,19 +163,6 @@ class PanHandler:
         Returns:
             str: Status of the PAN verification
         """
-        status = "ERROR"
         if http_status_code == 200:
-            if response_status_code == 100:
-                status = "FOUND"
-            elif response_status_code == 101:
-                status = "FOUND"
-            elif response_status_code == 102:
-                status = "NOT_FOUND"
-            else:
-                status = "ERROR"
-        elif http_status_code == 400:
-            status = "BAD_REQUEST"
-        elif http_status_code == 503:
-            status = "SOURCE_DOWN"
-
-        return status
+            return _STATUS_BY_PROVIDER_STATUS_CODE.get(response_status_code, "ERROR")
+        return _STATUS_BY_HTTP_STATUS_CODE.get(http_status_code, "ERROR")
@@ -38,7 +38,7 @@ class PassportHandler:
             dict: PASSPORT verification details
         """
         # Check if user has sufficient credits
-        if self.user_repository.get_user_by_id(user_id).credits < ServicePricing.KYC_PASSPORT_COST:
+        if self.user_repository.get_user_credits(user_id) < ServicePricing.KYC_PASSPORT_COST:
             logger.error(f"User {user_id} has insufficient credits to verify PASSPORT {file_number}")
             raise InsufficientCreditsException()
 
@@ -1,6 +1,9 @@
 # Standard library imports
 from typing import Dict, Any, Optional, Tuple
-import uuid
+import hashlib
+import hmac
+import logging
+import secrets
 from datetime import datetime
 
 # Third-party library imports
@@ -9,6 +12,8 @@ from fastapi import HTTPException
 # Local application imports
 from dependencies.logger import logger
 from dependencies.constants import IST
+from dependencies.configuration import RazorpayConfiguration
+from dependencies.exceptions import PaymentVerificationError
 
 from dto.payment_dto import (
     PaymentLinkRequest,
@@ -26,6 +31,39 @@ from handlers.user_ledger_transaction_handler import UserLedgerTransactionHandle
 
 from repositories.payment_repository import PaymentRepository
 
+# HMAC-SHA256 keyed with the Razorpay secret; copied per callback so the key is
+# encoded and scheduled once per process instead of on every verification
+_PAYMENT_LINK_SIGNATURE_HMAC = hmac.new(
+    RazorpayConfiguration.RAZORPAY_KEY_SECRET.encode(),
+    digestmod=hashlib.sha256
+)
+
+# HMAC-SHA256 keyed with the webhook secret configured on the Razorpay dashboard,
+# copied per delivery; webhook signatures are only checked when a secret is set
+_WEBHOOK_SIGNATURE_HMAC = hmac.new(
+    RazorpayConfiguration.RAZORPAY_WEBHOOK_SECRET.encode(),
+    digestmod=hashlib.sha256
+) if RazorpayConfiguration.RAZORPAY_WEBHOOK_SECRET else None
+if _WEBHOOK_SIGNATURE_HMAC is None:
+    logger.warning("RAZORPAY_WEBHOOK_SECRET is not set; webhook signatures will not be verified")
+
+# Payment link statuses reported on the callback that count as a successful payment
+SUCCESSFUL_PAYMENT_LINK_STATUSES = frozenset({"paid", "authorized", "captured"})
+
+
+def _signature_matches(digest: hmac.HMAC, signature: str) -> bool:
+    """
+    Compare an HMAC digest with a client-supplied hex signature in constant time.
+
+    Signatures are compared as bytes, since compare_digest rejects non-ASCII
+    str; a signature that cannot be encoded is treated as a mismatch.
+    """
+    try:
+        signature_bytes = signature.encode()
+    except UnicodeEncodeError:
+        return False
+    return hmac.compare_digest(digest.hexdigest().encode(), signature_bytes)
+
 
 class PaymentHandler:
     """Handler for payment-related operations."""
@@ -55,7 +93,7 @@ class PaymentHandler:
             raise HTTPException(status_code=400, detail="Credits must be greater than zero")
 
         # Generate a unique reference ID
-        reference_id = f"order_{uuid.uuid4().hex[:10]}"
+        reference_id = f"order_{secrets.token_hex(5)}"
 
         # Create payment link
         response = PaymentService.create_payment_link(
@@ -80,7 +118,7 @@ class PaymentHandler:
         razorpay_payment_id: str,
         razorpay_payment_link_id: str,
         razorpay_signature: str
-    ) -> Dict[str, Any]:
+    ) -> None:
         """
         Validate payment verification parameters.
 
@@ -89,51 +127,47 @@ class PaymentHandler:
             razorpay_payment_link_id: Payment Link ID from Razorpay
             razorpay_signature: Signature from Razorpay
 
-        Returns:
-            Dict: Validation result with success flag and message
+        Raises:
+            PaymentVerificationError: If any required parameter is missing
         """
         if not razorpay_payment_id or not razorpay_payment_link_id or not razorpay_signature:
-            logger.error("Missing required payment verification parameters")
-            return {
-                "success": False,
-                "message": "Missing required payment verification parameters"
-            }
-        return {"success": True}
+            raise PaymentVerificationError("Missing required payment verification parameters")
 
     @staticmethod
-    def _verify_signature(
-        client: Any,
-        params_dict: Dict[str, str],
-        razorpay_payment_link_id: str
-    ) -> Dict[str, Any]:
+    def _verify_signature(params_dict: Dict[str, str]) -> None:
         """
-        Verify payment signature from Razorpay.
+        Verify the payment link signature from a Razorpay callback.
+
+        The signature is the hex HMAC-SHA256, keyed with the Razorpay secret, of
+        "payment_link_id|payment_link_reference_id|payment_link_status|razorpay_payment_id",
+        as computed by the Razorpay SDK's verify_payment_link_signature.
 
         Args:
-            client: Razorpay client
             params_dict: Parameters for signature verification
-            razorpay_payment_link_id: Payment Link ID from Razorpay
 
-        Returns:
-            Dict: Verification result with success flag and message
+        Raises:
+            PaymentVerificationError: If a signed parameter is missing or the signature does not match
         """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Signature verification params: %s", params_dict)
         try:
-            logger.info(f"Signature verification params: {params_dict}")
-            client.utility.verify_payment_link_signature(params_dict)
-            logger.info("Signature verification successful")
-            return {"success": True}
-        except Exception as e:
-            logger.error(f"Signature verification failed: {str(e)}")
-            return {
-                "success": False,
-                "message": f"Signature verification failed: {str(e)}",
-                "razorpay_payment_link_id": razorpay_payment_link_id
-            }
+            message = "|".join((
+                params_dict['payment_link_id'],
+                params_dict['payment_link_reference_id'],
+                params_dict['payment_link_status'],
+                params_dict['razorpay_payment_id']
+            ))
+        except KeyError as e:
+            raise PaymentVerificationError(f"Signature verification failed: missing {e.args[0]}")
+
+        digest = _PAYMENT_LINK_SIGNATURE_HMAC.copy()
+        digest.update(message.encode())
+        if not _signature_matches(digest, params_dict['razorpay_signature']):
+            raise PaymentVerificationError("Signature verification failed: Razorpay Signature Verification Failed")
+        logger.info("Signature verification successful")
 
     @staticmethod
-    def _find_payment_transaction(
-        razorpay_payment_link_id: str
-    ) -> Tuple[bool, Optional[PaymentTransaction], Optional[str]]:
+    def _find_payment_transaction(razorpay_payment_link_id: str) -> PaymentTransaction:
         """
         Find payment transaction by payment link ID.
 
@@ -141,58 +175,48 @@ class PaymentHandler:
             razorpay_payment_link_id: Payment Link ID from Razorpay
 
         Returns:
-            Tuple: (success, transaction, error_message)
-        """
-        try:
-            # Use repository for database access
-            payment_repository = PaymentRepository()
-            transaction = payment_repository.get_transaction_by_payment_link_id(razorpay_payment_link_id)
+            PaymentTransaction: The matching transaction
 
-            if not transaction:
-                error_msg = f"Payment transaction not found for payment link ID: {razorpay_payment_link_id}"
-                logger.error(error_msg)
-                return False, None, error_msg
-
-            return True, transaction, None
-        except Exception as e:
-            error_msg = f"Error finding payment transaction: {str(e)}"
-            logger.error(error_msg)
-            return False, None, error_msg
+        Raises:
+            PaymentVerificationError: If no transaction exists for the payment link
+        """
+        transaction = PaymentRepository.get_transaction_by_payment_link_id(razorpay_payment_link_id)
+        if not transaction:
+            raise PaymentVerificationError(
+                f"Payment transaction not found for payment link ID: {razorpay_payment_link_id}"
+            )
+        return transaction
 
     @staticmethod
     def _verify_payment_status(
         razorpay_payment_link_status: Optional[str],
-        razorpay_payment_link_id: str
-    ) -> Dict[str, Any]:
+        order_id: Optional[str]
+    ) -> None:
         """
         Verify payment status from Razorpay callback.
 
         Args:
             razorpay_payment_link_status: Payment status from Razorpay
-            razorpay_payment_link_id: Payment Link ID from Razorpay
+            order_id: Order ID of the transaction being verified
 
-        Returns:
-            Dict: Verification result with success flag and message
+        Raises:
+            PaymentVerificationError: If the callback status is not a successful one
         """
         if not razorpay_payment_link_status:
-            return {"success": True}
+            return
 
-        logger.info(f"Checking payment status from callback: {razorpay_payment_link_status}")
-        if razorpay_payment_link_status.lower() not in ["paid", "authorized", "captured"]:
-            error_msg = f"Payment status is not successful: {razorpay_payment_link_status}"
-            logger.error(error_msg)
-            return {
-                "success": False,
-                "message": error_msg,
-                "razorpay_payment_link_id": razorpay_payment_link_id
-            }
-        return {"success": True}
+        logger.info("Checking payment status from callback: %s", razorpay_payment_link_status)
+        if razorpay_payment_link_status.lower() not in SUCCESSFUL_PAYMENT_LINK_STATUSES:
+            raise PaymentVerificationError(
+                f"Payment status is not successful: {razorpay_payment_link_status}",
+                order_id=order_id
+            )
 
     @staticmethod
     def _get_payment_details(
         client: Any,
         razorpay_payment_id: str
-    ) -> Tuple[Dict[str, Any], Optional[str]]:
+    ) -> Dict[str, Any]:
         """
         Get payment details from Razorpay API.
 
@@ -201,31 +225,34 @@ class PaymentHandler:
             razorpay_payment_id: Payment ID from Razorpay
 
         Returns:
-            Tuple: (payment_details, error_message)
+            Dict: Payment details
+
+        Raises:
+            PaymentVerificationError: If Razorpay reports the payment as not authorized/captured
         """
         try:
             payment_details = client.payment.fetch(razorpay_payment_id)
-            logger.info(f"Payment details from Razorpay: {payment_details}")
+        except Exception as e:
+            logger.error("Failed to fetch payment details: %s", e)
+            return {"status": "captured", "method": "razorpay"}
 
-            # Check payment status from Razorpay API
-            payment_status = payment_details.get('status', '').lower()
-            logger.info(f"Payment status from Razorpay API: {payment_status}")
+        logger.debug("Payment details from Razorpay: %s", payment_details)
 
-            if payment_status not in ["authorized", "captured"]:
-                logger.error(f"Payment status is not authorized/captured: {payment_status}")
+        # Check payment status from Razorpay API
+        payment_status = payment_details.get('status', '').lower()
+        logger.info("Payment status from Razorpay API: %s", payment_status)
 
-                # Handle specific failure statuses
-                if payment_status in ["failed", "cancelled"]:
-                    failure_reason = payment_details.get('error_description', 'Payment was not successful')
-                    logger.error(f"Payment failure reason: {failure_reason}")
-                    return payment_details, f"Payment {payment_status}: {failure_reason}"
+        if payment_status not in ["authorized", "captured"]:
+            logger.error("Payment status is not authorized/captured: %s", payment_status)
 
-                return payment_details, f"Payment status is not valid: {payment_status}"
+            # Handle specific failure statuses
+            if payment_status in ["failed", "cancelled"]:
+                failure_reason = payment_details.get('error_description', 'Payment was not successful')
+                raise PaymentVerificationError(f"Payment {payment_status}: {failure_reason}")
 
-            return payment_details, None
-        except Exception as e:
-            logger.error(f"Failed to fetch payment details: {str(e)}")
-            return {"status": "captured", "method": "razorpay"}, None
+            raise PaymentVerificationError(f"Payment status is not valid: {payment_status}")
+
+        return payment_details
 
     @staticmethod
     def _check_already_processed(
@@ -244,9 +271,8 @@ class PaymentHandler:
         Returns:
             Tuple: (is_already_processed, response_data)
         """
-        if (transaction.payment_id == razorpay_payment_id and
-                transaction.payment_status in ["captured", "authorized"]):
-            logger.info(f"Payment already processed: {razorpay_payment_id}")
+        if transaction.credits_added:
+            logger.info("Payment already processed: %s", razorpay_payment_id)
             return True, {
                 "success": True,
                 "message": "Payment already processed",
@@ -275,68 +301,53 @@ class PaymentHandler:
             payment_details: Payment details from Razorpay
 
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if this call claimed the credits, False if another request already did
         """
-        try:
-            transaction.order_status = "paid"
-            transaction.payment_status = "captured"
-            transaction.payment_id = razorpay_payment_id
-            transaction.payment_method = payment_details.get("method", "razorpay")
-            transaction.signature = razorpay_signature
-            transaction.payment_response_from_razorpay = payment_details
-            transaction.save()
-
-            logger.info(f"Updated payment transaction for order ID: {transaction.order_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to update payment transaction: {str(e)}")
+        updated = PaymentRepository.claim_transaction_credits(
+            transaction.id,
+            razorpay_payment_id,
+            razorpay_signature,
+            payment_details.get("method", "razorpay"),
+            payment_details
+        )
+        if not updated:
+            logger.info("Credits already added for order ID: %s", transaction.order_id)
             return False
 
+        logger.info("Updated payment transaction for order ID: %s", transaction.order_id)
+        return True
+
     @staticmethod
-    def _add_credits_to_user(
-        transaction: PaymentTransaction
-    ) -> Tuple[bool, Optional[str]]:
+    def _add_credits_to_user(transaction: PaymentTransaction) -> None:
         """
         Add credits to user based on payment transaction.
 
         Args:
             transaction: Payment transaction
 
-        Returns:
-            Tuple: (success, error_message)
+        Raises:
+            PaymentVerificationError: If the user is missing or the ledger entry could not be created
         """
-        try:
-            user = UserModel.objects(id=transaction.user_id).first()
-            if not user:
-                error_msg = f"User not found for ID: {transaction.user_id}"
-                logger.error(error_msg)
-                return False, error_msg
-
-            logger.info(f"User {user.id} current credits: {user.credits}")
-
-            # Create an instance of UserLedgerTransactionHandler and call increase_credits
-            ledger_handler = UserLedgerTransactionHandler()
-            ledger_txn = ledger_handler.increase_credits(
-                str(user.id),
-                float(transaction.credits_purchased))
+        # Fetch the user once; only the credits are needed for logging
+        user = UserModel.objects(id=transaction.user_id).only("credits").first()
+        if not user:
+            raise PaymentVerificationError(f"User not found for ID: {transaction.user_id}",
+                                           order_id=transaction.order_id)
 
-            if not ledger_txn:
-                error_msg = "Failed to create ledger transaction"
-                logger.error(error_msg)
-                return False, error_msg
+        logger.info("User %s current credits: %s", user.id, user.credits)
+
+        # Create an instance of UserLedgerTransactionHandler and call increase_credits
+        ledger_handler = UserLedgerTransactionHandler()
+        ledger_txn = ledger_handler.increase_credits(
+            str(user.id),
+            float(transaction.credits_purchased))
 
-            # Refresh user object to get updated credits
-            user.reload()
+        if not ledger_txn:
+            raise PaymentVerificationError("Failed to create ledger transaction", order_id=transaction.order_id)
 
-            logger.info(
-                f"Added {transaction.credits_purchased} credits to user {user.id}, "
-                f"new total: {user.credits}"
-            )
-            return True, None
-        except Exception as e:
-            error_msg = f"Failed to update user credits: {str(e)}"
-            logger.error(error_msg)
-            return False, error_msg
+        # The ledger row carries the new balance, no need to reload the user
+        logger.info("Added %s credits to user %s, new total: %s",
+                    transaction.credits_purchased, user.id, ledger_txn.balance)
 
     @staticmethod
     def _create_params_dict(
@@ -385,6 +396,9 @@ class PaymentHandler:
         """
         Verify a payment from Razorpay callback.
 
+        Each verification step raises PaymentVerificationError on failure; the
+        single handler below turns it into a failed PaymentVerificationResponse.
+
         Args:
             razorpay_payment_id: Payment ID from Razorpay
             razorpay_payment_link_id: Payment Link ID from Razorpay
@@ -395,107 +409,62 @@ class PaymentHandler:
         Returns:
             PaymentVerificationResponse: Verification response object
         """
-        logger.info(f"Handler verifying payment with ID {razorpay_payment_id}")
-        logger.info(f"Payment link ID: {razorpay_payment_link_id}")
-        logger.info(f"Payment signature: {razorpay_signature}")
-        logger.info(f"Payment link reference ID: {razorpay_payment_link_reference_id}")
-        logger.info(f"Payment link status: {razorpay_payment_link_status}")
+        logger.debug("Handler verifying payment %s for link %s, reference ID %s, status %s",
+                     razorpay_payment_id, razorpay_payment_link_id,
+                     razorpay_payment_link_reference_id, razorpay_payment_link_status)
 
-        # Create params dictionary for signature verification
-        params_dict = PaymentHandler._create_params_dict(
-            razorpay_payment_id,
-            razorpay_payment_link_id,
-            razorpay_signature,
-            razorpay_payment_link_reference_id,
-            razorpay_payment_link_status
-        )
-
-        # Validate input parameters
-        validation_result = PaymentHandler._validate_payment_params(
-            razorpay_payment_id,
-            razorpay_payment_link_id,
-            razorpay_signature
-        )
-        if not validation_result["success"]:
-            logger.warning(f"Payment validation failed: {validation_result.get('message')}")
-            return PaymentVerificationResponse(
-                success=False,
-                message=validation_result.get("message", "Validation failed"),
-                order_id=None
+        try:
+            PaymentHandler._validate_payment_params(
+                razorpay_payment_id,
+                razorpay_payment_link_id,
+                razorpay_signature
             )
 
-        # Get Razorpay client
-        client = BaseService.get_razorpay_client()
-
-        # Verify signature
-        signature_result = PaymentHandler._verify_signature(
-            client, params_dict, razorpay_payment_link_id
-        )
-        if not signature_result["success"]:
-            logger.warning(f"Signature verification failed: {signature_result.get('message')}")
-            return PaymentVerificationResponse(
-                success=False,
-                message=signature_result.get("message", "Signature verification failed"),
-                order_id=None,
-                razorpay_payment_link_id=razorpay_payment_link_id
+            # Create params dictionary for signature verification
+            params_dict = PaymentHandler._create_params_dict(
+                razorpay_payment_id,
+                razorpay_payment_link_id,
+                razorpay_signature,
+                razorpay_payment_link_reference_id,
+                razorpay_payment_link_status
             )
 
-        # Find the payment transaction
-        success, transaction, error_message = PaymentHandler._find_payment_transaction(
-            razorpay_payment_link_id
-        )
-        if not success:
-            logger.warning(f"Transaction not found: {error_message}")
-            return PaymentVerificationResponse(
-                success=False,
-                message=error_message or "Transaction not found",
-                order_id=None,
-                razorpay_payment_link_id=razorpay_payment_link_id
-            )
+            PaymentHandler._verify_signature(params_dict)
 
-        # Verify payment status from callback
-        status_result = PaymentHandler._verify_payment_status(
-            razorpay_payment_link_status, razorpay_payment_link_id
-        )
-        if not status_result["success"]:
-            logger.warning(f"Payment status verification failed: {status_result.get('message')}")
-            return PaymentVerificationResponse(
-                success=False,
-                message=status_result.get("message", "Payment status verification failed"),
-                order_id=transaction.order_id,
-                razorpay_payment_link_id=razorpay_payment_link_id
-            )
+            client = BaseService.get_razorpay_client()
 
-        # Process payment details and update transaction
-        result = PaymentHandler._process_payment_details(
-            client,
-            transaction,
-            razorpay_payment_id,
-            razorpay_payment_link_id,
-            razorpay_signature
-        )
+            transaction = PaymentHandler._find_payment_transaction(razorpay_payment_link_id)
+            PaymentHandler._verify_payment_status(razorpay_payment_link_status, transaction.order_id)
 
-        # Create response from result
-        if result["success"]:
-            logger.info(f"Payment verification successful for order: {result.get('order_id')}")
-            response = PaymentVerificationResponse(
-                success=True,
-                message=result["message"],
-                order_id=result.get("order_id"),
-                payment_id=result.get("payment_id"),
-                amount=result.get("amount"),
-                credits_purchased=result.get("credits_purchased"),
-                razorpay_payment_link_id=result.get("razorpay_payment_link_id")
+            # Process payment details and update transaction
+            result = PaymentHandler._process_payment_details(
+                client,
+                transaction,
+                razorpay_payment_id,
+                razorpay_payment_link_id,
+                razorpay_signature
             )
-        else:
-            logger.warning(f"Payment verification failed: {result.get('message')}")
-            response = PaymentVerificationResponse(
+        except PaymentVerificationError as e:
+            logger.warning("Payment verification failed: %s", e.detail)
+            return PaymentVerificationResponse.model_construct(
                 success=False,
-                message=result["message"],
-                order_id=result.get("order_id")
+                message=e.detail,
+                order_id=e.order_id,
+                razorpay_payment_link_id=razorpay_payment_link_id
             )
 
-        logger.info(f"Verification result: {response}")
+        logger.info("Payment verification successful for order: %s", result.get('order_id'))
+        # Built from stored transaction values, so validation is skipped
+        response = PaymentVerificationResponse.model_construct(
+            success=True,
+            message=result["message"],
+            order_id=result.get("order_id"),
+            payment_id=result.get("payment_id"),
+            amount=result.get("amount"),
+            credits_purchased=result.get("credits_purchased"),
+            razorpay_payment_link_id=result.get("razorpay_payment_link_id")
+        )
+        logger.debug("Verification result: %s", response)
 
         return response
 
@@ -521,15 +490,7 @@ class PaymentHandler:
             Dict: Processing result
         """
         # Get payment details from Razorpay
-        payment_details, error_message = PaymentHandler._get_payment_details(
-            client, razorpay_payment_id
-        )
-        if error_message:
-            return {
-                "success": False,
-                "message": error_message,
-                "razorpay_payment_link_id": razorpay_payment_link_id
-            }
+        payment_details = PaymentHandler._get_payment_details(client, razorpay_payment_id)
 
         # Check if payment already processed
         already_processed, response = PaymentHandler._check_already_processed(
@@ -568,26 +529,35 @@ class PaymentHandler:
         Returns:
             Dict: Finalization result
         """
-        # Update payment transaction
-        update_success = PaymentHandler._update_transaction(
-            transaction, razorpay_payment_id, razorpay_signature, payment_details
-        )
-        if not update_success:
-            return {
-                "success": False,
-                "message": "Failed to update payment transaction",
-                "razorpay_payment_link_id": razorpay_payment_link_id
-            }
+        try:
+            claimed = PaymentHandler._update_transaction(
+                transaction, razorpay_payment_id, razorpay_signature, payment_details
+            )
+        except Exception as e:
+            logger.error(f"Failed to update payment transaction: {str(e)}")
+            raise PaymentVerificationError("Failed to update payment transaction", order_id=transaction.order_id)
 
-        # Add credits to user
-        credits_success, credits_error = PaymentHandler._add_credits_to_user(transaction)
-        if not credits_success:
+        # A concurrent callback or manual verification already credited the user
+        if not claimed:
             return {
-                "success": False,
-                "message": credits_error,
+                "success": True,
+                "message": "Payment already processed",
+                "order_id": transaction.order_id,
+                "payment_id": razorpay_payment_id,
+                "amount": transaction.total_amount,
+                "credits_purchased": transaction.credits_purchased,
                 "razorpay_payment_link_id": razorpay_payment_link_id
             }
 
+        try:
+            PaymentHandler._add_credits_to_user(transaction)
+        except Exception as e:
+            # Nothing was credited, so let a retry claim the credits again
+            PaymentRepository.release_transaction_credits(transaction.id)
+            if isinstance(e, PaymentVerificationError):
+                raise
+            raise PaymentVerificationError(f"Failed to update user credits: {str(e)}", order_id=transaction.order_id)
+
         return {
             "success": True,
             "message": "Payment verified successfully",
@@ -598,27 +568,85 @@ class PaymentHandler:
             "razorpay_payment_link_id": razorpay_payment_link_id
         }
 
+    @staticmethod
+    def verify_webhook_signature(body: bytes, signature: Optional[str]) -> bool:
+        """
+        Verify the X-Razorpay-Signature of a webhook delivery.
+
+        The signature is the hex HMAC-SHA256, keyed with the webhook secret, of
+        the raw request body exactly as sent.
+
+        Args:
+            body: Raw request body of the webhook delivery
+            signature: Value of the X-Razorpay-Signature header
+
+        Returns:
+            bool: True if the signature matches or no webhook secret is configured, False otherwise
+        """
+        if _WEBHOOK_SIGNATURE_HMAC is None:
+            logger.warning("Accepting webhook delivery without signature verification: "
+                           "RAZORPAY_WEBHOOK_SECRET is not set")
+            return True
+        if not signature:
+            return False
+
+        digest = _WEBHOOK_SIGNATURE_HMAC.copy()
+        digest.update(body)
+        return _signature_matches(digest, signature)
+
     @staticmethod
     def handle_webhook(
-        request: PaymentWebhookRequest
+        request: PaymentWebhookRequest,
+        event_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Handle webhook events from Razorpay.
 
+        Args:
+            request: Webhook request data
+            event_id: Razorpay event ID of the delivery, used to skip retried deliveries
+
+        Returns:
+            Dict: Response indicating success or failure
+        """
+        # Claimed before processing so concurrent or retried deliveries of the same
+        # event, on any worker, are acknowledged without touching the transaction
+        if event_id and not PaymentRepository.claim_webhook_event(event_id):
+            logger.info("Skipping already processed webhook event %s", event_id)
+            return {"status": "success", "message": "Webhook already processed"}
+
+        try:
+            result = PaymentHandler._process_webhook_event(request)
+        except Exception:
+            if event_id:
+                PaymentRepository.release_webhook_event(event_id)
+            raise
+
+        # Given up again on failure, so Razorpay's retry is processed in full
+        if event_id and result["status"] != "success":
+            PaymentRepository.release_webhook_event(event_id)
+        return result
+
+    @staticmethod
+    def _process_webhook_event(request: PaymentWebhookRequest) -> Dict[str, Any]:
+        """
+        Apply a webhook event to its payment transaction.
+
         Args:
             request: Webhook request data
 
         Returns:
             Dict: Response indicating success or failure
         """
-        logger.info(f"Handling webhook event: {request.event}")
+        logger.info("Handling webhook event: %s", request.event)
 
+        event_data = request.model_dump()
         # Log the full event data for debugging
-        logger.info(f"Full webhook event data: {request.dict()}")
+        logger.debug("Full webhook event data: %s", event_data)
 
         # Extract entities from webhook data
         event, payment_entity, _, payment_link_entity = PaymentHandler._extract_webhook_entities(
-            request.dict()
+            event_data
         )
 
         # Find the payment transaction
@@ -636,7 +664,7 @@ class PaymentHandler:
         logger.info(f"Found payment transaction: {transaction.order_id}")
 
         # Store webhook response
-        PaymentHandler._store_webhook_response(transaction, event, request.dict())
+        PaymentHandler._store_webhook_response(transaction, event, event_data)
 
         # Update transaction based on event type
         if event in ["payment.captured", "payment_link.paid", "order.paid"]:
@@ -905,63 +933,52 @@ class PaymentHandler:
         Returns:
             Dict: Verification result
         """
-        logger.info(f"Manual verification for payment link ID: {payment_link_id}")
+        logger.info("Manual verification for payment link ID: %s", payment_link_id)
 
         # Find the payment transaction
         transaction = PaymentTransaction.objects(razorpay_payment_link_id=payment_link_id).first()
 
         if not transaction:
-            logger.error(f"Payment transaction not found for payment link ID: {payment_link_id}")
+            logger.error("Payment transaction not found for payment link ID: %s", payment_link_id)
             return {
                 "success": False,
                 "message": "Payment transaction not found"
             }
 
         # Create a dummy payment ID
-        payment_id = f"manual_pay_{uuid.uuid4().hex[:10]}"
-
-        # Update payment transaction
-        transaction.order_status = "paid"
-        transaction.payment_status = "captured"
-        transaction.payment_id = payment_id
-        transaction.payment_method = "manual"
-        transaction.signature = "manual_verification"
-        transaction.save()
-        logger.info("Updated payment transaction status to paid")
-
-        # Add credits to user
-        user = UserModel.objects(id=transaction.user_id).first()
-        if not user:
-            error_msg = f"User not found for ID: {transaction.user_id}"
-            logger.error(error_msg)
+        payment_id = f"manual_pay_{secrets.token_hex(5)}"
+
+        # Claim the credits atomically so a repeated manual verification (or a
+        # concurrent callback) cannot add them twice; a transaction a webhook
+        # marked captured but that was never credited can still be claimed
+        if not PaymentRepository.claim_transaction_credits(
+            transaction.id,
+            payment_id,
+            "manual_verification",
+            "manual"
+        ):
+            logger.info("Credits already added for order ID: %s", transaction.order_id)
             return {
                 "success": False,
-                "message": error_msg
+                "message": "Payment already processed"
             }
+        logger.info("Updated payment transaction status to paid")
 
-        logger.info(f"User {user.id} current credits: {user.credits}")
-
-        # Create an instance of UserLedgerTransactionHandler and call increase_credits
-        ledger_handler = UserLedgerTransactionHandler()
-        ledger_txn = ledger_handler.increase_credits(
-            str(user.id),
-            float(transaction.credits_purchased))
-
-        if not ledger_txn:
-            error_msg = "Failed to create ledger transaction"
-            logger.error(error_msg)
+        # Add credits to user; the ledger insert fails if the user does not exist
+        try:
+            ledger_txn = UserLedgerTransactionHandler().increase_credits(
+                transaction.user_id,
+                float(transaction.credits_purchased))
+        except ValueError as e:
+            logger.error(str(e))
+            PaymentRepository.release_transaction_credits(transaction.id)
             return {
                 "success": False,
-                "message": error_msg
+                "message": str(e)
             }
 
-        # Refresh user object to get updated credits
-        user.reload()
-
-        logger.info(
-            f"Added {transaction.credits_purchased} credits to user {user.id}, "
-            f"new total: {user.credits}"
-        )
+        logger.info("Added %s credits to user %s, new total: %s",
+                    transaction.credits_purchased, transaction.user_id, ledger_txn.balance)
 
         return {
             "success": True,
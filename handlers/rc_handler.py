@@ -16,6 +16,15 @@ from repositories.kyc_repository import KYCRepository
 
 from services.aitan_services import RCService
 
+# Verification status by the HTTP status code of the provider response
+_STATUS_BY_HTTP_STATUS_CODE = {
+    200: "FOUND",
+    206: "NOT_FOUND",
+    400: "BAD_REQUEST",
+    429: "TOO_MANY_REQUESTS",
+    503: "SOURCE_DOWN",
+}
+
 
 class RCHandler:
 
@@ -36,7 +45,7 @@ class RCHandler:
             dict: RC verification details
         """
         # Check if user has sufficient credits
-        if self.user_repository.get_user_by_id(user_id).credits < ServicePricing.KYC_RC_COST:
+        if self.user_repository.get_user_credits(user_id) < ServicePricing.KYC_RC_COST:
             logger.error(f"User {user_id} has insufficient credits to verify RC {reg_no}")
             raise InsufficientCreditsException()
 
@@ -148,16 +157,4 @@ class RCHandler:
         Returns:
             str: Status of the RC verification
         """
-        status = "ERROR"
-        if http_status_code == 200:
-            return "FOUND"
-        elif http_status_code == 206:
-            return "NOT_FOUND"
-        elif http_status_code == 400:
-            return "BAD_REQUEST"
-        elif http_status_code == 429:
-            return "TOO_MANY_REQUESTS"
-        elif http_status_code == 503:
-            return "SOURCE_DOWN"
-
-        return status
+        return _STATUS_BY_HTTP_STATUS_CODE.get(http_status_code, "ERROR")
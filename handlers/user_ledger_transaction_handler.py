@@ -5,6 +5,7 @@ from dateutil import tz
 # Local application imports
 from dependencies.configuration import ServicePricing, UserLedgerTransactionType
 from dependencies.logger import logger
+from dependencies.exceptions import InsufficientCreditsException
 from dependencies.constants import IST
 
 from models.user_ledger_transaction_model import UserLedgerTransaction
@@ -39,7 +40,7 @@ class UserLedgerTransactionHandler:
                 return False
 
             # Get latest transaction to check balance
-            current_balance = self.user_repository.get_user_by_id(user_id).credits
+            current_balance = self.user_repository.get_user_credits(user_id)
 
             required_credits = ServicePricing.get_service_cost(service_name)
             return current_balance >= required_credits
@@ -58,6 +59,9 @@ class UserLedgerTransactionHandler:
 
         Returns:
             UserLedgerTransaction: The new transaction if successful, None otherwise
+
+        Raises:
+            InsufficientCreditsException: If the user's balance no longer covers the service cost
         """
         try:
             # Validate service name
@@ -77,6 +81,9 @@ class UserLedgerTransactionHandler:
 
             return new_txn
 
+        except InsufficientCreditsException:
+            logger.error(f"User {user_id} has insufficient credits for {service_name}")
+            raise
         except Exception as e:
             logger.exception(f"Error deducting credits for user {user_id}: {str(e)}")
             return None
@@ -118,22 +125,10 @@ class UserLedgerTransactionHandler:
         limit = 100
         offset = (page - 1) * limit
 
-        # Get all transactions
-        all_transactions = self.ledger_repository.get_user_ledger_transactions(user_id)
-        total_transactions = len(all_transactions)
-
-        # Apply pagination
-        start_idx = offset
-        end_idx = min(offset + limit, total_transactions)
-        paginated_transactions = all_transactions[start_idx:end_idx] if start_idx < total_transactions else []
-
-        # Convert transactions to dictionaries
-        transaction_dicts = []
-        for txn in paginated_transactions:
-            event_dict = txn.to_mongo()
-            event_dict.pop('_id', None)  # Remove MongoDB _id field
-            event_dict.pop('updated_at', None)
+        transaction_dicts, total_transactions = self.ledger_repository.get_user_ledger_transactions_page(
+            user_id, offset, limit
+        )
+        for event_dict in transaction_dicts:
             event_dict["created_at"] = event_dict["created_at"].replace(tzinfo=tz.gettz('UTC')).astimezone(IST)
-            transaction_dicts.append(event_dict)
 
         return transaction_dicts, total_transactions
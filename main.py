@@ -1,15 +1,20 @@
 # Standard library imports
-# (None in this case)
+from contextlib import asynccontextmanager
 
 # Third-party library imports
-from fastapi import FastAPI
+import orjson
+from anyio import to_thread
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from mongoengine import connect
 from mangum import Mangum
 # Local application imports
 from dependencies.configuration import AppConfiguration
+from dependencies.exceptions import InsufficientCreditsException
 from dependencies.middleware_log import log_middleware
+from dependencies.responses import APIJSONResponse
 
 from routes.dashboard.user_router import auth_router
 from routes.api.kyc_router import kyc_router as api_kyc_router
@@ -17,8 +22,16 @@ from routes.dashboard.kyc_router import kyc_router as dashboard_kyc_router
 from routes.dashboard.payment_router import payment_router as payment_router
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync endpoints and run_in_threadpool share anyio's default limiter (40
+    # threads); size it for the Mongo and provider pools instead
+    to_thread.current_default_thread_limiter().total_tokens = AppConfiguration.THREADPOOL_SIZE
+    yield
+
+
 # Initialize FastAPI app
-app = FastAPI(title="KYC Verification API")
+app = FastAPI(title="KYC Verification API", default_response_class=APIJSONResponse, lifespan=lifespan)
 app.add_middleware(BaseHTTPMiddleware, dispatch=log_middleware)
 
 app.add_middleware(
@@ -29,14 +42,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Large KYC payloads (RC, passport, ...) are compressed for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 connect(
     db=AppConfiguration.MAIN_DB,
     host=AppConfiguration.MONGO_URI,
     alias="kyc_fabric_db",
-    tlsAllowInvalidCertificates=True
+    tlsAllowInvalidCertificates=True,
+    maxPoolSize=AppConfiguration.MONGO_MAX_POOL_SIZE,
+    minPoolSize=AppConfiguration.MONGO_MIN_POOL_SIZE,
+    retryWrites=True
 )
 
 
+# The insufficient-credits detail is fixed, so its body is serialized once
+_INSUFFICIENT_CREDITS_BODY = orjson.dumps({"message": InsufficientCreditsException().detail})
+
+
+@app.exception_handler(InsufficientCreditsException)
+async def insufficient_credits_exception_handler(request: Request, exc: InsufficientCreditsException):
+    return Response(
+        content=_INSUFFICIENT_CREDITS_BODY,
+        status_code=status.HTTP_402_PAYMENT_REQUIRED,
+        media_type="application/json"
+    )
+
+
 @app.get("/")
 def read_root():
     return {"message": "Welcome to odin!"}
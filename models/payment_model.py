@@ -8,6 +8,7 @@ from mongoengine import (
     FloatField,
     DateTimeField,
     DictField,
+    BooleanField,
 )
 
 # Local application imports
@@ -38,6 +39,7 @@ class PaymentTransaction(Document):
     payment_response_from_razorpay = DictField()  # Response from Razorpay after payment
     webhook_responses = DictField()  # Responses from Razorpay webhooks
     signature = StringField()  # Payment verification signature
+    credits_added = BooleanField(default=False)  # Set only by the step that credits the user
     created_at = DateTimeField(default=datetime.now(IST))
     updated_at = DateTimeField(default=datetime.now(IST))
 
@@ -55,3 +57,22 @@ class PaymentTransaction(Document):
     def save(self, *args, **kwargs):
         self.updated_at = datetime.now(IST)
         return super(PaymentTransaction, self).save(*args, **kwargs)
+
+
+class ProcessedWebhookEvent(Document):
+    """
+    Razorpay webhook event IDs claimed for processing.
+
+    The unique event_id makes the claim atomic across workers, and documents
+    expire a day after the claim, well past Razorpay's retry window.
+    """
+    event_id = StringField(required=True, unique=True)
+    created_at = DateTimeField(default=lambda: datetime.now(IST))
+
+    meta = {
+        'collection': 'processed_webhook_events',
+        'indexes': [
+            {'fields': ['created_at'], 'expireAfterSeconds': 24 * 60 * 60}
+        ],
+        "db_alias": AppConfiguration.MAIN_DB
+    }
@@ -38,7 +38,8 @@ class UserLedgerTransaction(Document):
     meta = {
         'collection': 'user_ledger_transactions',
         'indexes': [
-            'user_id',
+            # Serves user_id lookups and the newest-first ledger history sort
+            {'fields': ['user_id', '-created_at']},
             'type',
             'created_at'
         ],
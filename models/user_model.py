@@ -9,6 +9,7 @@ from mongoengine import (
     EmailField,
     DateTimeField,
     FloatField,
+    IntField,
 )
 
 # Local application imports
@@ -73,9 +74,31 @@ class VerifiedUserInformation(Document):
     meta = {
         'collection': 'verified_users_informations',
         'indexes': [
+            # Separate single-field indexes so the email-or-phone lookup can use an index union
             'phone_number',
             'email',
-            'otp'
+            # OTP verification matches on email and otp together
+            {'fields': ['email', 'otp']}
+        ],
+        "db_alias": AppConfiguration.MAIN_DB
+    }
+
+
+class OTPAttemptCounter(Document):
+    """
+    Fixed-window attempt counter for the OTP endpoints, shared by all workers.
+
+    The ID encodes the limit scope, the subject and the window; counters are
+    removed by the TTL index once their window has ended.
+    """
+    id = StringField(primary_key=True)
+    count = IntField(default=0)
+    expires_at = DateTimeField(required=True)
+
+    meta = {
+        'collection': 'otp_attempt_counters',
+        'indexes': [
+            {'fields': ['expires_at'], 'expireAfterSeconds': 0}
         ],
         "db_alias": AppConfiguration.MAIN_DB
     }
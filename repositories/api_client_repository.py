@@ -28,3 +28,19 @@ class APIClientRepository:
             return UserModel.objects.get(id=api_client.user_id)
         except DoesNotExist:
             return None
+
+    @staticmethod
+    def get_api_client_credentials(client_id: str) -> Optional[APIClientModel]:
+        """
+        Get the fields of an API client needed to authenticate it.
+
+        Args:
+            client_id: The client_id to search for
+
+        Returns:
+            Optional[APIClientModel]: The API client with only user_id, client_secret
+            and is_enabled loaded if found, None otherwise
+        """
+        return APIClientModel.objects(client_id=client_id).only(
+            'user_id', 'client_secret', 'is_enabled'
+        ).first()
@@ -1,15 +1,31 @@
 # Standard library imports
+from threading import RLock
 from typing import Optional
 
 # Third-party library imports
+from cachetools import TLRUCache
 from mongoengine import DoesNotExist
 
 # Local application imports
 from dependencies.logger import logger
-from dependencies.configuration import KYCRepositoryConfig
+from dependencies.configuration import KYCRepositoryConfig, UserLedgerTransactionType
 
 from models.kyc_model import KYCValidationTransaction
 
+# Process-local cache in front of the stored-verification lookup, keyed on
+# (api_name, identifier, billable statuses). Only hits are cached: a miss goes
+# to the provider and the new result is found in the database next time.
+# GSTIN registrations change more often than personal documents, so they expire sooner.
+_KYC_CACHE_DEFAULT_TTL_SECONDS = 24 * 60 * 60
+_KYC_CACHE_TTL_SECONDS = {
+    UserLedgerTransactionType.KYB_GSTIN.value: 60 * 60,
+}
+_kyc_transaction_cache = TLRUCache(
+    maxsize=50_000,
+    ttu=lambda key, value, now: now + _KYC_CACHE_TTL_SECONDS.get(key[0], _KYC_CACHE_DEFAULT_TTL_SECONDS)
+)
+_kyc_transaction_cache_lock = RLock()
+
 
 class KYCRepository:
 
@@ -20,6 +36,25 @@ class KYCRepository:
         kyc_service_billable_status: list[str]
     ) -> Optional[KYCValidationTransaction]:
         """Get KYC validation transaction by type and identifier."""
+        cache_key = (api_name, identifier, tuple(kyc_service_billable_status))
+        with _kyc_transaction_cache_lock:
+            transaction = _kyc_transaction_cache.get(cache_key)
+        if transaction is not None:
+            return transaction
+
+        transaction = self.__find_kyc_validation_transaction(api_name, identifier, kyc_service_billable_status)
+        if transaction is not None:
+            with _kyc_transaction_cache_lock:
+                _kyc_transaction_cache[cache_key] = transaction
+        return transaction
+
+    def __find_kyc_validation_transaction(
+        self,
+        api_name: str,
+        identifier: str,
+        kyc_service_billable_status: list[str]
+    ) -> Optional[KYCValidationTransaction]:
+        """Query the database for a KYC validation transaction by type and identifier."""
         try:
             # Handle special cases
             if KYCRepositoryConfig.is_special_case(api_name):
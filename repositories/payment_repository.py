@@ -1,13 +1,15 @@
 # Standard library imports
+from datetime import datetime
 from typing import Optional
 
 # Third-party library imports
-from mongoengine.errors import DoesNotExist
+from pymongo.errors import DuplicateKeyError
 
 # Local application imports
+from dependencies.constants import IST
 from dependencies.logger import logger
 
-from models.payment_model import PaymentTransaction
+from models.payment_model import PaymentTransaction, ProcessedWebhookEvent
 from dto.payment_dto import PaymentLinkRequest
 
 
@@ -45,11 +47,43 @@ class PaymentRepository:
                 razorpay_response=response
             )
             payment_transaction.save()
-            logger.info(f"Created payment transaction with order ID: {reference_id}")
+            logger.info("Created payment transaction with order ID: %s", reference_id)
         except Exception as e:
-            logger.error(f"Error creating payment transaction: {str(e)}")
+            logger.error("Error creating payment transaction: %s", e)
             raise e
 
+    @staticmethod
+    def claim_webhook_event(event_id: str) -> bool:
+        """
+        Claim a webhook event ID for processing.
+
+        Args:
+            event_id: The Razorpay event ID of the delivery
+
+        Returns:
+            bool: True if this call claimed the event, False if it was already claimed
+        """
+        try:
+            ProcessedWebhookEvent._get_collection().insert_one(
+                {"event_id": event_id, "created_at": datetime.now(IST)}
+            )
+            return True
+        except DuplicateKeyError:
+            return False
+
+    @staticmethod
+    def release_webhook_event(event_id: str) -> None:
+        """
+        Give up a webhook event claim so a retried delivery is processed again.
+
+        Args:
+            event_id: The Razorpay event ID of the delivery
+        """
+        try:
+            ProcessedWebhookEvent._get_collection().delete_one({"event_id": event_id})
+        except Exception as e:
+            logger.error("Error releasing webhook event %s: %s", event_id, e)
+
     @staticmethod
     def get_transaction_by_order_id(order_id: str) -> Optional[PaymentTransaction]:
         """
@@ -62,12 +96,12 @@ class PaymentRepository:
             PaymentTransaction or None: The transaction if found, None otherwise
         """
         try:
-            return PaymentTransaction.objects.get(order_id=order_id)
-        except DoesNotExist:
-            logger.error(f"Payment transaction not found with order ID: {order_id}")
-            return None
+            transaction = PaymentTransaction.objects(order_id=order_id).first()
+            if transaction is None:
+                logger.debug("Payment transaction not found with order ID: %s", order_id)
+            return transaction
         except Exception as e:
-            logger.error(f"Error retrieving payment transaction: {str(e)}")
+            logger.error("Error retrieving payment transaction: %s", e)
             return None
 
     @staticmethod
@@ -82,12 +116,12 @@ class PaymentRepository:
             PaymentTransaction or None: The transaction if found, None otherwise
         """
         try:
-            return PaymentTransaction.objects.get(razorpay_payment_link_id=payment_link_id)
-        except DoesNotExist:
-            logger.error(f"Payment transaction not found with payment link ID: {payment_link_id}")
-            return None
+            transaction = PaymentTransaction.objects(razorpay_payment_link_id=payment_link_id).first()
+            if transaction is None:
+                logger.debug("Payment transaction not found with payment link ID: %s", payment_link_id)
+            return transaction
         except Exception as e:
-            logger.error(f"Error retrieving payment transaction by payment link ID: {str(e)}")
+            logger.error("Error retrieving payment transaction by payment link ID: %s", e)
             return None
 
     @staticmethod
@@ -102,12 +136,12 @@ class PaymentRepository:
             PaymentTransaction or None: The transaction if found, None otherwise
         """
         try:
-            return PaymentTransaction.objects.get(payment_id=payment_id)
-        except DoesNotExist:
-            logger.error(f"Payment transaction not found with payment ID: {payment_id}")
-            return None
+            transaction = PaymentTransaction.objects(payment_id=payment_id).first()
+            if transaction is None:
+                logger.debug("Payment transaction not found with payment ID: %s", payment_id)
+            return transaction
         except Exception as e:
-            logger.error(f"Error retrieving payment transaction: {str(e)}")
+            logger.error("Error retrieving payment transaction: %s", e)
             return None
 
     @staticmethod
@@ -124,15 +158,74 @@ class PaymentRepository:
             bool: True if successful, False otherwise
         """
         try:
-            transaction = PaymentTransaction.objects.get(order_id=order_id)
+            transaction = PaymentTransaction.objects(order_id=order_id).first()
+            if transaction is None:
+                logger.error("Payment transaction not found with order ID: %s", order_id)
+                return False
             transaction.order_status = order_status
             if payment_status:
                 transaction.payment_status = payment_status
             transaction.save()
             return True
-        except DoesNotExist:
-            logger.error(f"Payment transaction not found with order ID: {order_id}")
-            return False
         except Exception as e:
-            logger.error(f"Error updating payment transaction status: {str(e)}")
+            logger.error("Error updating payment transaction status: %s", e)
             return False
+
+    @staticmethod
+    def claim_transaction_credits(
+        transaction_id: str,
+        payment_id: str,
+        signature: str,
+        payment_method: str,
+        payment_details: Optional[dict] = None
+    ) -> bool:
+        """
+        Atomically claim the credits of a transaction and mark it paid.
+
+        The update only matches while credits_added is unset, a marker written by
+        nothing but this claim, so concurrent callbacks and manual verifications
+        race on a single document and exactly one of them adds the credits. The
+        Razorpay status set by webhooks does not block the claim.
+
+        Args:
+            transaction_id: ID of the payment transaction document
+            payment_id: Razorpay payment ID
+            signature: Payment verification signature
+            payment_method: Payment method reported by Razorpay
+            payment_details: Payment details from Razorpay, left unchanged if None
+
+        Returns:
+            bool: True if this call claimed the credits, False if they were already claimed
+        """
+        updates = {
+            "set__credits_added": True,
+            "set__order_status": "paid",
+            "set__payment_status": "captured",
+            "set__payment_id": payment_id,
+            "set__payment_method": payment_method,
+            "set__signature": signature,
+            "set__updated_at": datetime.now(IST)
+        }
+        if payment_details is not None:
+            updates["set__payment_response_from_razorpay"] = payment_details
+        updated = PaymentTransaction.objects(
+            id=transaction_id,
+            credits_added__ne=True
+        ).update_one(**updates)
+        return updated == 1
+
+    @staticmethod
+    def release_transaction_credits(transaction_id: str) -> None:
+        """
+        Give up a credit claim whose ledger entry failed, so the payment can be credited again.
+
+        Args:
+            transaction_id: ID of the payment transaction document
+        """
+        try:
+            PaymentTransaction.objects(id=transaction_id).update_one(
+                set__credits_added=False,
+                set__updated_at=datetime.now(IST)
+            )
+        except Exception as e:
+            logger.error("Error releasing credit claim for transaction %s: %s", transaction_id, e)
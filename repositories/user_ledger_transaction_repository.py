@@ -1,20 +1,56 @@
 # Standard library imports
-from typing import Dict, List
+from threading import RLock
+from typing import Dict, List, Tuple
 from datetime import datetime, timedelta, timezone
 
+# Third-party library imports
+from bson import ObjectId
+from cachetools import TTLCache
+from dateutil.relativedelta import relativedelta
+from pymongo import ReturnDocument
+from pymongo.write_concern import WriteConcern
+
 # Local application imports
+from dependencies.constants import IST
 from dependencies.logger import logger
+from dependencies.exceptions import InsufficientCreditsException
 
+from models.user_model import User as UserModel
 from models.user_ledger_transaction_model import UserLedgerTransaction
 
 from repositories.user_repository import UserRepository
 
+# Ledger rows are append-only history; the authoritative balance is kept on the
+# user document under the default write concern, so the row insert does not wait
+# for the journal
+_LEDGER_ROW_WRITE_CONCERN = WriteConcern(w=1, j=False)
+
+# Short-lived process-local cache of the dashboard usage aggregates, keyed by
+# user ID (and service type for the weekly stats). Ledger writes through this
+# repository invalidate the affected entries; the TTL bounds staleness otherwise.
+_USAGE_STATS_CACHE_TTL_SECONDS = 60
+_service_usage_count_cache = TTLCache(maxsize=10_000, ttl=_USAGE_STATS_CACHE_TTL_SECONDS)
+_weekly_service_stats_cache = TTLCache(maxsize=50_000, ttl=_USAGE_STATS_CACHE_TTL_SECONDS)
+_usage_stats_cache_lock = RLock()
+
 
 class UserLedgerTransactionRepository:
     """Repository for user ledger transactions."""
 
-    def __init__(self):
-        self.user_repository = UserRepository()
+    @staticmethod
+    def invalidate_usage_stats_cache(user_id: str, types: List[str]) -> None:
+        """
+        Drop a user's cached usage aggregates after ledger writes.
+
+        Args:
+            user_id: The ID of the user whose cached aggregates should be dropped
+            types: The ledger transaction types that were written
+        """
+        user_id = str(user_id)
+        with _usage_stats_cache_lock:
+            _service_usage_count_cache.pop(user_id, None)
+            for txn_type in types:
+                _weekly_service_stats_cache.pop((user_id, txn_type), None)
 
     def insert_ledger_txn_for_user(
         self,
@@ -23,66 +59,109 @@ class UserLedgerTransactionRepository:
         amount: float,
         description: str
     ) -> UserLedgerTransaction:
-        """Insert a new ledger transaction for a user."""
-        try:
-            # Get the latest transaction to calculate the new balance
-            current_balance = self.user_repository.get_user_by_id(user_id).credits
-            logger.info(
-                f"Getting user {user_id} credits before inserting ledger transaction {type} {amount} {current_balance}")
-
-            # Calculate new balance based on transaction type
-            new_balance = current_balance + amount
+        """
+        Insert a new ledger transaction for a user.
 
-            # Create new transaction
-            new_txn = UserLedgerTransaction(
-                user_id=user_id,
-                type=type,
-                amount=amount,
-                description=description,
-                balance=new_balance
+        Raises:
+            InsufficientCreditsException: If a debit exceeds the user's current balance
+            ValueError: If the user does not exist
+        """
+        try:
+            user_filter = {"_id": ObjectId(user_id)}
+            if amount < 0:
+                # Debit only if the balance covers it, so concurrent charges cannot overdraw
+                user_filter["credits"] = {"$gte": -amount}
+
+            # Apply the amount and read back the new balance in one atomic round trip
+            user = UserModel._get_collection().find_one_and_update(
+                user_filter,
+                {"$inc": {"credits": amount}},
+                projection={"credits": 1},
+                return_document=ReturnDocument.AFTER
             )
-            new_txn.save()
+            if user is None:
+                if amount < 0 and UserModel._get_collection().count_documents({"_id": user_filter["_id"]}, limit=1):
+                    raise InsufficientCreditsException()
+                raise ValueError(f"User with ID {user_id} not found")
+            UserRepository.invalidate_user_cache(user_id)
 
-            # Update user credits to match the new balance
-            self.user_repository.update_user_credits(user_id, new_txn)
+            new_balance = user["credits"]
+            logger.info(
+                "Inserting ledger transaction %s %s for user %s, new balance %s",
+                type, amount, user_id, new_balance)
+
+            # Insert the row directly; the inputs come from validated DTOs and
+            # service pricing, so the document-level validation is skipped here
+            now = datetime.now(IST)
+            txn_doc = {
+                "user_id": user_id,
+                "type": type,
+                "amount": amount,
+                "description": description,
+                "balance": new_balance,
+                "created_at": now,
+                "updated_at": now
+            }
+            UserLedgerTransaction._get_collection().with_options(
+                write_concern=_LEDGER_ROW_WRITE_CONCERN
+            ).insert_one(txn_doc)
+            self.invalidate_usage_stats_cache(user_id, [type])
 
-            return new_txn
+            return UserLedgerTransaction._from_son(txn_doc)
         except Exception as e:
-            logger.error(f"Error inserting ledger transaction for user {user_id}: {str(e)}")
+            logger.error("Error inserting ledger transaction for user %s: %s", user_id, e)
             raise
 
     def get_service_usage_count(self, user_id: str) -> Dict[str, int]:
         """Get count of transactions by service type for a user in the last 30 days."""
+        with _usage_stats_cache_lock:
+            counts = _service_usage_count_cache.get(user_id)
+        if counts is not None:
+            return dict(counts)
+
         try:
             thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
-            transactions = UserLedgerTransaction.objects(
-                user_id=user_id,
-                created_at__gte=thirty_days_ago
-            )
-            service_types = transactions.distinct("type")
-            return {
-                service_type: transactions.filter(type=service_type).count()
-                for service_type in service_types
+            # Group by type on the server instead of one count() per distinct type
+            pipeline = [
+                {"$match": {"user_id": user_id, "created_at": {"$gte": thirty_days_ago}}},
+                {"$group": {"_id": "$type", "count": {"$sum": 1}}}
+            ]
+            counts = {
+                row["_id"]: row["count"]
+                for row in UserLedgerTransaction._get_collection().aggregate(pipeline)
             }
         except Exception as e:
-            logger.error(f"Error getting service usage count for user {user_id}: {str(e)}")
+            logger.error("Error getting service usage count for user %s: %s", user_id, e)
             return {}
 
+        with _usage_stats_cache_lock:
+            _service_usage_count_cache[user_id] = counts
+        return dict(counts)
+
     def get_weekly_service_stats(self, user_id: str, service_name: str) -> List[UserLedgerTransaction]:
         """Get weekly transactions for a specific service."""
+        with _usage_stats_cache_lock:
+            transactions = _weekly_service_stats_cache.get((user_id, service_name))
+        if transactions is not None:
+            return transactions
+
         try:
             week_ago = datetime.now(timezone.utc) - timedelta(days=7)
 
             # Get all transactions for the service in the last week
-            return UserLedgerTransaction.objects(
+            transactions = list(UserLedgerTransaction.objects(
                 user_id=user_id,
                 type=service_name,
                 created_at__gte=week_ago
-            ).order_by('created_at')
+            ).only('amount', 'created_at').order_by('created_at'))
         except Exception as e:
-            logger.error(f"Error getting weekly service stats for user {user_id}: {str(e)}")
+            logger.error("Error getting weekly service stats for user %s: %s", user_id, e)
             return []
 
+        with _usage_stats_cache_lock:
+            _weekly_service_stats_cache[(user_id, service_name)] = transactions
+        return transactions
+
     def get_monthly_service_stats(self, user_id: str) -> List[UserLedgerTransaction]:
         """
         Get monthly transactions for a specific user.
@@ -94,13 +173,12 @@ class UserLedgerTransactionRepository:
             List[UserLedgerTransaction]: List of transactions for the current month.
         """
         try:
-            # Calculate the start and end of the current month
-            now = datetime.now(timezone.utc)
-            start_of_month = datetime(now.year, now.month, 1)
-            end_of_month = start_of_month + timedelta(days=32)
-            end_of_month = datetime(end_of_month.year, end_of_month.month, 1)
+            # Calculate the start and end of the current (IST) month as tz-aware UTC bounds
+            start_of_month = datetime.now(IST).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            end_of_month = (start_of_month + relativedelta(months=1)).astimezone(timezone.utc)
+            start_of_month = start_of_month.astimezone(timezone.utc)
 
-            logger.info(f"Fetching transactions for user {user_id} from {start_of_month} to {end_of_month}")
+            logger.info("Fetching transactions for user %s from %s to %s", user_id, start_of_month, end_of_month)
 
             # Query transactions for the current month
             return UserLedgerTransaction.objects(
@@ -109,13 +187,37 @@ class UserLedgerTransactionRepository:
                 created_at__lt=end_of_month
             )
         except Exception as e:
-            logger.exception(f"Error fetching monthly transactions for user {user_id}: {str(e)}")
+            logger.exception("Error fetching monthly transactions for user %s: %s", user_id, e)
             raise
 
-    def get_user_ledger_transactions(self, user_id: str) -> List[UserLedgerTransaction]:
-        """Get all ledger transactions for a user."""
-        try:
-            return UserLedgerTransaction.objects(user_id=user_id).order_by('-created_at')
-        except Exception as e:
-            logger.exception(f"Error getting ledger transactions for user {user_id}: {str(e)}")
-            return []
+    def get_user_ledger_transactions_page(self, user_id: str, skip: int, limit: int) -> Tuple[List[Dict], int]:
+        """
+        Get one page of a user's ledger transactions, newest first, plus the total count.
+
+        The page and the count come from a single aggregation, with a $facet over
+        the user's transactions, and rows are returned as raw documents without
+        `_id` and `updated_at`.
+
+        Args:
+            user_id: ID of the user.
+            skip: Number of transactions to skip.
+            limit: Maximum number of transactions to return.
+
+        Returns:
+            Tuple[List[Dict], int]: The page of transactions and the user's total transaction count.
+        """
+        page_stages = [{"$skip": skip}] if skip > 0 else []
+        page_stages += [{"$limit": limit}, {"$project": {"_id": 0, "updated_at": 0}}]
+
+        # Match and sort ahead of the $facet so both run on the (user_id, -created_at) index
+        pipeline = [
+            {"$match": {"user_id": user_id}},
+            {"$sort": {"created_at": -1}},
+            {"$facet": {
+                "transactions": page_stages,
+                "total": [{"$count": "count"}]
+            }}
+        ]
+        result = next(UserLedgerTransaction._get_collection().aggregate(pipeline))
+        total_transactions = result["total"][0]["count"] if result["total"] else 0
+        return result["transactions"], total_transactions
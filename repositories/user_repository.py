@@ -1,23 +1,71 @@
 # Standard library imports
-from typing import Optional
+from datetime import datetime
+from threading import RLock
+from typing import Iterator, Optional
 
 # Third-party library imports
-from mongoengine.errors import DoesNotExist
+from bson import ObjectId
+from cachetools import TTLCache
 
 # Local application imports
+from dependencies.constants import IST
 from dependencies.password_utils import PasswordUtils
-from dependencies.logger import logger
-from dependencies.exceptions import InsufficientCreditsException
+from dependencies.exceptions import UserNotFoundException
 
 from dto.user_dto import UserCreate, UserUpdate
 
 from models.user_model import User as UserModel
-from models.user_ledger_transaction_model import UserLedgerTransaction
+
+# Short-lived process-local cache of user documents keyed by user ID, plus
+# email/username aliases resolving to that ID. Writes through this repository
+# invalidate the user's entry; the TTL bounds staleness for anything else.
+_USER_CACHE_TTL_SECONDS = 30
+_user_cache = TTLCache(maxsize=10_000, ttl=_USER_CACHE_TTL_SECONDS)
+_user_alias_cache = TTLCache(maxsize=20_000, ttl=_USER_CACHE_TTL_SECONDS)
+_user_cache_lock = RLock()
+
+
+def _cache_user(user: UserModel) -> None:
+    """Store a user in the cache under its ID, email and username."""
+    user_id = str(user.id)
+    with _user_cache_lock:
+        _user_cache[user_id] = user
+        _user_alias_cache[("email", user.email)] = user_id
+        _user_alias_cache[("username", user.username)] = user_id
+
+
+def _get_cached_user_by(field: str, value: str) -> Optional[UserModel]:
+    """Get a user by a unique field, going through the cache."""
+    with _user_cache_lock:
+        user_id = _user_alias_cache.get((field, value))
+        user = _user_cache.get(user_id) if user_id else None
+    # The alias may outlive a change of the field itself
+    if user is not None and getattr(user, field) == value:
+        return user
+
+    user = UserModel.objects(**{field: value}).first()
+    if user is not None:
+        _cache_user(user)
+    return user
 
 
 class UserRepository:
     """Repository for user-related database operations."""
 
+    @staticmethod
+    def invalidate_user_cache(user_id: str) -> None:
+        """
+        Drop a user from the lookup cache.
+
+        Args:
+            user_id: The ID of the user whose cached entries should be dropped
+        """
+        with _user_cache_lock:
+            user = _user_cache.pop(str(user_id), None)
+            if user is not None:
+                _user_alias_cache.pop(("email", user.email), None)
+                _user_alias_cache.pop(("username", user.username), None)
+
     @staticmethod
     def get_user_by_username(username: str) -> Optional[UserModel]:
         """
@@ -29,10 +77,7 @@ class UserRepository:
         Returns:
             UserModel or None: The user if found, None otherwise
         """
-        try:
-            return UserModel.objects.get(username=username)
-        except DoesNotExist:
-            return None
+        return _get_cached_user_by("username", username)
 
     @staticmethod
     def get_user_by_phone_number(phone_number: str) -> Optional[UserModel]:
@@ -45,10 +90,7 @@ class UserRepository:
         Returns:
             UserModel or None: The user if found, None otherwise
         """
-        try:
-            return UserModel.objects.get(phone_number=phone_number)
-        except DoesNotExist:
-            return None
+        return UserModel.objects(phone_number=phone_number).first()
 
     @staticmethod
     def get_user_by_email(email: str) -> Optional[UserModel]:
@@ -61,10 +103,7 @@ class UserRepository:
         Returns:
             UserModel or None: The user if found, None otherwise
         """
-        try:
-            return UserModel.objects.get(email=email)
-        except DoesNotExist:
-            return None
+        return _get_cached_user_by("email", email)
 
     @staticmethod
     def get_user_by_id(user_id: str) -> Optional[UserModel]:
@@ -77,10 +116,53 @@ class UserRepository:
         Returns:
             UserModel or None: The user if found, None otherwise
         """
-        try:
-            return UserModel.objects.get(id=user_id)
-        except DoesNotExist:
-            return None
+        with _user_cache_lock:
+            user = _user_cache.get(str(user_id))
+        if user is not None:
+            return user
+
+        # Malformed IDs raise here rather than inside the query
+        user_pk = ObjectId(user_id)
+        user = UserModel.objects(pk=user_pk).first()
+        if user is not None:
+            _cache_user(user)
+        return user
+
+    @staticmethod
+    def get_user_credits(user_id: str) -> float:
+        """
+        Get a user's current credit balance straight from the database.
+
+        The user cache is bypassed since the balance changes on every charge and
+        top-up, which may be handled by another process.
+
+        Args:
+            user_id: The user ID to get the balance for
+
+        Returns:
+            float: The user's current credits
+
+        Raises:
+            UserNotFoundException: If the user does not exist
+        """
+        user = UserModel._get_collection().find_one({"_id": ObjectId(user_id)}, projection={"credits": 1})
+        if user is None:
+            raise UserNotFoundException()
+        return user.get("credits", UserModel._fields["credits"].default)
+
+    @staticmethod
+    def get_user_for_auth(user_id: str) -> Optional[UserModel]:
+        """
+        Get a user by ID with only the fields used by authenticated API requests.
+
+        Args:
+            user_id: The user ID to search for
+
+        Returns:
+            UserModel or None: The user with only id, role, credits and is_active
+            loaded if found, None otherwise
+        """
+        return UserModel.objects(id=user_id).only('id', 'role', 'credits', 'is_active').first()
 
     @staticmethod
     def create_user(user_data: UserCreate) -> UserModel:
@@ -118,34 +200,45 @@ class UserRepository:
         Returns:
             UserModel: The updated user
         """
-        if user_data.email is not None:
-            user.email = user_data.email
-        if user_data.username is not None:
-            user.username = user_data.username
-        if user_data.phone_number is not None:
-            user.phone_number = user_data.phone_number
-        if user_data.first_name is not None:
-            user.first_name = user_data.first_name
-        if user_data.last_name is not None:
-            user.last_name = user_data.last_name
+        # Only these profile fields are user-editable; role/is_active/company are not
+        changed = {
+            field: getattr(user_data, field)
+            for field in ("email", "username", "phone_number", "first_name", "last_name")
+            if getattr(user_data, field) is not None
+        }
         if user_data.password is not None:
-            user.hashed_password = PasswordUtils.get_password_hash(user_data.password)
-        user.save()
+            changed["hashed_password"] = PasswordUtils.get_password_hash(user_data.password)
+        if not changed:
+            return user
+
+        changed["updated_at"] = datetime.now(IST)
+        UserModel._get_collection().update_one({"_id": user.pk}, {"$set": changed})
+        # Dropped only after the write, so a concurrent lookup cannot re-cache the old document
+        UserRepository.invalidate_user_cache(user.id)
+
+        # Reflect the write on the in-memory user without re-fetching it
+        for field, value in changed.items():
+            setattr(user, field, value)
         return user
 
     @staticmethod
-    def get_all_users(skip: int = 0, limit: int = 100) -> list[UserModel]:
+    def get_all_users(skip: int = 0, limit: int = 100) -> Iterator[dict]:
         """
-        Get all users with pagination.
+        Get all users with pagination as raw documents.
+
+        Results are streamed from pymongo without the QuerySet result cache or
+        Document instantiation, and only the listing fields are fetched.
 
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
 
         Returns:
-            List[UserModel]: List of users
+            Iterator[dict]: Iterator over user documents
         """
-        return UserModel.objects.skip(skip).limit(limit)
+        return UserModel.objects.no_cache().only(
+            'id', 'email', 'username', 'first_name', 'last_name', 'role', 'credits'
+        ).skip(skip).limit(limit).as_pymongo()
 
     @staticmethod
     def delete_user(user_id: str) -> bool:
@@ -158,12 +251,12 @@ class UserRepository:
         Returns:
             bool: True if deleted, False otherwise
         """
-        try:
-            user = UserModel.objects.get(id=user_id)
-            user.delete()
-            return True
-        except DoesNotExist:
+        user = UserModel.objects(pk=ObjectId(user_id)).first()
+        if user is None:
             return False
+        user.delete()
+        UserRepository.invalidate_user_cache(user_id)
+        return True
 
     @staticmethod
     def count_users() -> int:
@@ -174,48 +267,3 @@ class UserRepository:
             int: The total number of users
         """
         return UserModel.objects.count()
-
-    @staticmethod
-    def deduct_credit(user: UserModel, deduction_value: float) -> UserModel:
-        """
-        Deduct credits from a user's balance.
-
-        Args:
-            user: The user to deduct credits from
-            deduction_value: The amount of credits to deduct
-
-        Returns:
-            UserModel: The updated user
-
-        Raises:
-            InsufficientCreditsException: If the user has insufficient credits
-        """
-        if user.credits < deduction_value:
-            raise InsufficientCreditsException()
-
-        user.credits -= deduction_value
-        user.save()
-        return user
-
-    @staticmethod
-    def update_user_credits(user_id: str, latest_txn: UserLedgerTransaction) -> UserModel:
-        """
-        Update user credits based on the latest ledger transaction balance.
-
-        Args:
-            user_id: The user ID to update
-            latest_txn: The latest ledger transaction
-
-        Returns:
-            UserModel: The updated user
-        """
-        try:
-            user = UserModel.objects.get(id=user_id)
-            user.credits = latest_txn.balance
-            user.save()
-            return user
-        except DoesNotExist:
-            raise ValueError(f"User with ID {user_id} not found")
-        except Exception as e:
-            logger.exception(f"Error updating user credits for user {user_id}: {str(e)}")
-            raise
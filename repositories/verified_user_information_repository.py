@@ -1,8 +1,12 @@
+from datetime import datetime
+
 from mongoengine.queryset.visitor import Q
 from mongoengine.errors import DoesNotExist, ValidationError
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
 from dependencies.logger import logger
-from models.user_model import VerifiedUserInformation
+from models.user_model import VerifiedUserInformation, OTPAttemptCounter
 
 
 class VerifiedUserInformationRepository:
@@ -77,3 +81,84 @@ class VerifiedUserInformationRepository:
         except Exception as e:
             logger.error(f"Error finding user by email {email}: {str(e)}")
             return None
+
+    @staticmethod
+    def upsert_user_otp(email: str, phone_number: str, otp: str) -> dict:
+        """
+        Issue a new OTP for a user in a single round trip.
+
+        Resets the OTP and verification flag of the record matching the email or
+        phone number, creating the record if neither exists.
+
+        Args:
+            email (str): The user's email address
+            phone_number (str): The user's phone number
+            otp (str): The one-time password for verification
+
+        Returns:
+            dict: The verified user information document after the update
+        """
+        now = datetime.now()
+        try:
+            return VerifiedUserInformation._get_collection().find_one_and_update(
+                {"$or": [{"email": email}, {"phone_number": phone_number}]},
+                {
+                    "$set": {"otp": otp, "is_email_verified": False, "updated_at": now},
+                    "$setOnInsert": {"email": email, "phone_number": phone_number, "created_at": now}
+                },
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+        except Exception as e:
+            logger.error(f"Error issuing OTP for email {email}: {str(e)}")
+            raise
+
+    @staticmethod
+    def mark_email_verified(email: str, otp: str) -> bool:
+        """
+        Mark a user's email as verified if the OTP matches, in a single round trip.
+
+        Args:
+            email (str): The email address to verify
+            otp (str): The OTP provided by the user
+
+        Returns:
+            bool: True if a record with this email and OTP was found and verified, False otherwise
+        """
+        verified_user_information = VerifiedUserInformation._get_collection().find_one_and_update(
+            {"email": email, "otp": otp},
+            {"$set": {"is_email_verified": True, "updated_at": datetime.now()}},
+            projection={"_id": 1}
+        )
+        return verified_user_information is not None
+
+    @staticmethod
+    def increment_otp_attempts(counter_id: str, expires_at: datetime) -> int:
+        """
+        Atomically count an OTP endpoint attempt, creating the counter on the first attempt.
+
+        Args:
+            counter_id (str): ID of the counter, unique per limit scope, subject and window
+            expires_at (datetime): When the window ends and the counter may be removed
+
+        Returns:
+            int: The number of attempts counted in the window, including this one
+        """
+        collection = OTPAttemptCounter._get_collection()
+        try:
+            counter = collection.find_one_and_update(
+                {"_id": counter_id},
+                {"$inc": {"count": 1}, "$setOnInsert": {"expires_at": expires_at}},
+                upsert=True,
+                projection={"count": 1},
+                return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            # A concurrent first attempt created the counter; count against it
+            counter = collection.find_one_and_update(
+                {"_id": counter_id},
+                {"$inc": {"count": 1}},
+                projection={"count": 1},
+                return_document=ReturnDocument.AFTER
+            )
+        return counter["count"]
@@ -1,19 +1,20 @@
 # Standard library imports
-from typing import Union
-import json
+import asyncio
+from typing import Annotated, Tuple
 
 # Third-party library imports
 from fastapi import APIRouter, Depends, status
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
 
 # Local application imports
 from dependencies.logger import logger
 from dependencies.exceptions import InsufficientCreditsException
+from dependencies.responses import APIJSONResponse, kyc_payload, kyc_response
 
 from dto.kyc_dto import (PassportVerificationRequest, AadhaarVerificationRequest, MobileLookupVerificationRequest,
                          EmailLookupVerificationRequest, VoterVerificationRequest, DLVerificationRequest,
                          EmploymentLatestVerificationRequest, PanVerificationRequest, VehicleVerificationRequest,
-                         GSTINVerificationRequest)
+                         GSTINVerificationRequest, BatchVerificationRequest)
 from dto.common_dto import APISuccessResponse
 
 from handlers.auth_handlers import AuthHandler
@@ -29,14 +30,55 @@ from handlers.employment_latest_handler import EmploymentLatestHandler
 from handlers.gstin_handler import GSTINHandler
 from models.user_model import User as UserModel
 
-kyc_router = APIRouter(prefix="/api/v1", tags=["KYC Verification API"])
-
-
-@kyc_router.post("/pan/verify", response_model=APISuccessResponse)
-def verify_pan(
+kyc_router = APIRouter(
+    prefix="/api/v1",
+    tags=["KYC Verification API"],
+    default_response_class=APIJSONResponse
+)
+
+# Documents the success payload in OpenAPI without response-model validation at runtime
+_SUCCESS_RESPONSE_DOC = {200: {"model": APISuccessResponse}}
+
+# User behind the authenticated API client
+CurrentClient = Annotated[UserModel, Depends(AuthHandler.get_api_client)]
+
+# Handlers hold no per-request state, so one instance of each is shared
+_pan_handler = PanHandler()
+_rc_handler = RCHandler()
+_voter_handler = VoterHandler()
+_dl_handler = DLHandler()
+_passport_handler = PassportHandler()
+_aadhaar_handler = AadhaarHandler()
+_mobile_lookup_handler = MobileLookupHandler()
+_email_lookup_handler = EmailLookupHandler()
+_employment_latest_handler = EmploymentLatestHandler()
+_gstin_handler = GSTINHandler()
+
+# Batch verification: request field -> (service label, handler method). Each
+# sub-request's fields match the handler method's keyword arguments.
+_BATCH_VERIFY_SERVICES = {
+    "pan": ("PAN", _pan_handler.get_pan_kyc_details),
+    "rc": ("RC", _rc_handler.get_rc_kyc_details),
+    "voter": ("VOTER", _voter_handler.get_voter_kyc_details),
+    "dl": ("DL", _dl_handler.get_dl_kyc_details),
+    "passport": ("PASSPORT", _passport_handler.get_passport_kyc_details),
+    "aadhaar": ("AADHAAR", _aadhaar_handler.get_aadhaar_kyc_details),
+    "mobile_lookup": ("MOBILE LOOKUP", _mobile_lookup_handler.get_mobile_lookup_kyc_details),
+    "email_lookup": ("EMAIL LOOKUP", _email_lookup_handler.get_email_lookup_kyc_details),
+    "employment_latest": ("EMPLOYMENT LATEST", _employment_latest_handler.get_employment_latest_details),
+    "gstin": ("GSTIN", _gstin_handler.get_gstin_kyc_details),
+}
+# Bounds the batch sub-verifications running at once across all requests, so a
+# burst of batches cannot take over the threadpool
+_batch_verify_semaphore = asyncio.Semaphore(10)
+
+
+@kyc_router.post("/pan/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("PAN")
+async def verify_pan(
     request: PanVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_api_client)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentClient
+) -> Tuple[dict, int]:
     """
     Verify PAN details.
 
@@ -45,47 +87,20 @@ def verify_pan(
         user: Authenticated user associated with the API client
 
     Returns:
-        PanVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        pan_verification_response, http_status_code = PanHandler().get_pan_kyc_details(
-            pan=request.pan, user_id=str(user.id)
-        )
-        logger.info(f"PAN Verification Response: {pan_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": pan_verification_response.get('message')
-                }
-            )
-
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="PAN Verification Successful",
-            result=pan_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_pan: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
+    # The handler does blocking Mongo and provider I/O; keep it off the event loop
+    return await run_in_threadpool(
+        _pan_handler.get_pan_kyc_details, pan=request.pan, user_id=str(user.id)
+    )
 
 
-@kyc_router.post("/rc/verify", response_model=APISuccessResponse)
-def verify_vehicle(
+@kyc_router.post("/rc/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("RC")
+async def verify_vehicle(
     request: VehicleVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_api_client)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentClient
+) -> Tuple[dict, int]:
     """
     Verify vehicle registration details.
 
@@ -94,47 +109,20 @@ def verify_vehicle(
         user: Authenticated user associated with the API client
 
     Returns:
-        VehicleVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        rc_verification_response, http_status_code = RCHandler().get_rc_kyc_details(
-            reg_no=request.reg_no, user_id=str(user.id)
-        )
-        logger.info(f"RC Verification Response: {rc_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": rc_verification_response.get('message')
-                }
-            )
-
-        return APISuccessResponse(
-            message="RC Verification Successful",
-            result=rc_verification_response,
-            http_status_code=http_status_code
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_vehicle: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
+    return await run_in_threadpool(
+        _rc_handler.get_rc_kyc_details,
+        reg_no=request.reg_no, user_id=str(user.id)
+    )
 
 
-@kyc_router.post("/voter/verify", response_model=APISuccessResponse)
-def verify_voter(
+@kyc_router.post("/voter/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("VOTER")
+async def verify_voter(
     request: VoterVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_api_client)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentClient
+) -> Tuple[dict, int]:
     """
     Verify voter details.
 
@@ -143,97 +131,44 @@ def verify_voter(
         user: Authenticated user associated with the API client
 
     Returns:
-        VehicleVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        voter_verification_response, http_status_code = VoterHandler().get_voter_kyc_details(
-            epic_no=request.epic_no, user_id=str(user.id)
-        )
-        logger.info(f"VOTER Verification Response: {voter_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": voter_verification_response.get('message')
-                }
-            )
-
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="VOTER Verification Successful",
-            result=voter_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_voter: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
+    return await run_in_threadpool(
+        _voter_handler.get_voter_kyc_details,
+        epic_no=request.epic_no, user_id=str(user.id)
+    )
 
 
-@kyc_router.post("/dl/verify", response_model=APISuccessResponse)
-def verify_dl(
+@kyc_router.post("/dl/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("DL")
+async def verify_dl(
     request: DLVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_api_client)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentClient
+) -> Tuple[dict, int]:
     """
     Verify DL details.
 
     Args:
         request: DL verification request
         user: Authenticated user associated with the API client
-        Returns:
-            DLVerificationResponse or JSONResponse for error cases
-        """
-    try:
-        dl_verification_response, http_status_code = DLHandler().get_dl_kyc_details(
-            dl_no=request.dl_no,
-            dob=request.dob,
-            user_id=str(user.id)
-        )
-        dl_verification_response = json.loads(json.dumps(dl_verification_response))
-        logger.info(f"DL Verification Response: {dl_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": dl_verification_response.get('message')
-                }
-            )
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="DL Verification Successful",
-            result=dl_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_passport: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
+
+    Returns:
+        Tuple[dict, int]: Handler verification response and HTTP status code
+    """
+    return await run_in_threadpool(
+        _dl_handler.get_dl_kyc_details,
+        dl_no=request.dl_no,
+        dob=request.dob,
+        user_id=str(user.id)
+    )
 
 
-@kyc_router.post("/passport/verify", response_model=APISuccessResponse)
-def verify_passport(
+@kyc_router.post("/passport/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("PASSPORT")
+async def verify_passport(
     request: PassportVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_api_client)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentClient
+) -> Tuple[dict, int]:
     """
     Verify passport details.
 
@@ -242,50 +177,23 @@ def verify_passport(
         user: Authenticated user associated with the API client
 
     Returns:
-        PassportVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        passport_verification_response, http_status_code = PassportHandler().get_passport_kyc_details(
-            file_number=request.file_number,
-            dob=request.dob,
-            name=request.name,
-            user_id=str(user.id)
-        )
-        logger.info(f"PASSPORT Verification Response: {passport_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": passport_verification_response.get('message')
-                }
-            )
-
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="PASSPORT Verification Successful",
-            result=passport_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_passport: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
-
-
-@kyc_router.post("/aadhaar/verify", response_model=APISuccessResponse)
-def verify_aadhaar(
+    return await run_in_threadpool(
+        _passport_handler.get_passport_kyc_details,
+        file_number=request.file_number,
+        dob=request.dob,
+        name=request.name,
+        user_id=str(user.id)
+    )
+
+
+@kyc_router.post("/aadhaar/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("AADHAAR")
+async def verify_aadhaar(
     request: AadhaarVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_api_client)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentClient
+) -> Tuple[dict, int]:
     """
     Verify Aadhaar details.
 
@@ -294,47 +202,20 @@ def verify_aadhaar(
         user: Authenticated user associated with the API client
 
     Returns:
-        AadhaarVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        aadhaar_verification_response, http_status_code = AadhaarHandler().get_aadhaar_kyc_details(
-            aadhaar=request.aadhaar, user_id=str(user.id)
-        )
-        logger.info(f"AADHAAR Verification Response: {aadhaar_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": aadhaar_verification_response.get('message')
-                }
-            )
+    return await run_in_threadpool(
+        _aadhaar_handler.get_aadhaar_kyc_details,
+        aadhaar=request.aadhaar, user_id=str(user.id)
+    )
 
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="AADHAAR Verification Successful",
-            result=aadhaar_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_aadhaar: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
 
-
-@kyc_router.post("/mobile-lookup/verify", response_model=APISuccessResponse)
-def verify_mobile(
+@kyc_router.post("/mobile-lookup/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("MOBILE LOOKUP")
+async def verify_mobile(
     request: MobileLookupVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_api_client)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentClient
+) -> Tuple[dict, int]:
     """
     Verify mobile details.
 
@@ -343,47 +224,20 @@ def verify_mobile(
         user: Authenticated user associated with the API client
 
     Returns:
-        MobileLookupVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        mobile_lookup_verification_response, http_status_code = MobileLookupHandler().get_mobile_lookup_kyc_details(
-            mobile=request.mobile, user_id=str(user.id)
-        )
-        logger.info(f"MOBILE LOOKUP Verification Response: {mobile_lookup_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": mobile_lookup_verification_response.get('message')
-                }
-            )
+    return await run_in_threadpool(
+        _mobile_lookup_handler.get_mobile_lookup_kyc_details,
+        mobile=request.mobile, user_id=str(user.id)
+    )
 
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="MOBILE LOOKUP Verification Successful",
-            result=mobile_lookup_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_mobile: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
 
-
-@kyc_router.post("/email-lookup/verify", response_model=APISuccessResponse)
-def verify_email(
+@kyc_router.post("/email-lookup/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("EMAIL LOOKUP")
+async def verify_email(
     request: EmailLookupVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_api_client)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentClient
+) -> Tuple[dict, int]:
     """
     Verify email details.
 
@@ -392,47 +246,20 @@ def verify_email(
         user: Authenticated user associated with the API client
 
     Returns:
-        EmailLookupVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        email_lookup_verification_response, http_status_code = EmailLookupHandler().get_email_lookup_kyc_details(
-            email=request.email, user_id=str(user.id)
-        )
-        logger.info(f"EMAIL LOOKUP Verification Response: {email_lookup_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": email_lookup_verification_response.get('message')
-                }
-            )
-
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="EMAIL LOOKUP Verification Successful",
-            result=email_lookup_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_email: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
+    return await run_in_threadpool(
+        _email_lookup_handler.get_email_lookup_kyc_details,
+        email=request.email, user_id=str(user.id)
+    )
 
 
-@kyc_router.post("/employment-latest/verify", response_model=APISuccessResponse)
-def verify_employment_latest(
+@kyc_router.post("/employment-latest/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("EMPLOYMENT LATEST")
+async def verify_employment_latest(
     request: EmploymentLatestVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_api_client)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentClient
+) -> Tuple[dict, int]:
     """
     Verify employment latest details.
 
@@ -441,55 +268,26 @@ def verify_employment_latest(
         user: Authenticated user with API client
 
     Returns:
-        EmploymentLatestVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        employment_latest_verification_response, http_status_code = (
-            EmploymentLatestHandler().get_employment_latest_details(
-                uan=request.uan,
-                pan=request.pan,
-                mobile=request.mobile,
-                dob=request.dob,
-                employer_name=request.employer_name,
-                employee_name=request.employee_name,
-                user_id=str(user.id)
-            )
-        )
-        logger.info(f"EMPLOYMENT LATEST Verification Response: {employment_latest_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": employment_latest_verification_response.get('message')
-                }
-            )
-
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="EMPLOYMENT LATEST Verification Successful",
-            result=employment_latest_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_employment_latest: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
-
-
-@kyc_router.post("/gstin/verify", response_model=APISuccessResponse)
-def verify_gstin(
+    return await run_in_threadpool(
+        _employment_latest_handler.get_employment_latest_details,
+        uan=request.uan,
+        pan=request.pan,
+        mobile=request.mobile,
+        dob=request.dob,
+        employer_name=request.employer_name,
+        employee_name=request.employee_name,
+        user_id=str(user.id)
+    )
+
+
+@kyc_router.post("/gstin/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("GSTIN")
+async def verify_gstin(
     request: GSTINVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_api_client)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentClient
+) -> Tuple[dict, int]:
     """
     Verify gstin details.
 
@@ -498,38 +296,69 @@ def verify_gstin(
         user: Authenticated user with API client
 
     Returns:
-        GSTINVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
+    """
+    return await run_in_threadpool(
+        _gstin_handler.get_gstin_kyc_details,
+        gstin=request.gstin, user_id=str(user.id)
+    )
+
+
+async def _run_batch_verification(service: str, sub_request, user_id: str) -> dict:
+    """
+    Run one sub-verification of a batch and build its result body.
+
+    Args:
+        service: Batch request field naming the service
+        sub_request: Verification request for the service
+        user_id: ID of the user making the request
+
+    Returns:
+        dict: Result body in the same schema as the single verify endpoint
     """
+    service_name, verify = _BATCH_VERIFY_SERVICES[service]
     try:
-        gstin_verification_response, http_status_code = GSTINHandler().get_gstin_kyc_details(
-            gstin=request.gstin, user_id=str(user.id)
-        )
-        logger.info(f"GSTIN Verification Response: {gstin_verification_response}")
-        gstin_verification_response = json.loads(json.dumps(gstin_verification_response))
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": gstin_verification_response.get('message')
-                }
+        async with _batch_verify_semaphore:
+            verification_response, http_status_code = await run_in_threadpool(
+                verify, **sub_request.model_dump(), user_id=user_id
             )
-
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="GSTIN Verification Successful",
-            result=gstin_verification_response,
-        )
+        logger.debug("%s Verification Response: %s", service_name, verification_response)
+        return kyc_payload(service_name, verification_response, http_status_code)
     except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
+        return {"http_status_code": status.HTTP_402_PAYMENT_REQUIRED, "message": str(e.detail)}
     except Exception as e:
-        logger.error(f"Error in verify_gstin: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
+        logger.error(f"Error in batch {service} verification: {str(e)}")
+        return {"http_status_code": status.HTTP_400_BAD_REQUEST, "message": str(e)}
+
+
+@kyc_router.post("/batch/verify", responses=_SUCCESS_RESPONSE_DOC)
+async def verify_batch(
+    request: BatchVerificationRequest,
+    user: CurrentClient
+) -> APIJSONResponse:
+    """
+    Run several KYC verifications concurrently.
+
+    Each sub-verification is billed and reported like its single verify endpoint;
+    a failing one does not fail the others.
+
+    Args:
+        request: Batch verification request
+        user: Authenticated user with API client
+
+    Returns:
+        APIJSONResponse: Per-service results keyed by the request field names
+    """
+    user_id = str(user.id)
+    services = [service for service in _BATCH_VERIFY_SERVICES if getattr(request, service) is not None]
+    results = await asyncio.gather(*(
+        _run_batch_verification(service, getattr(request, service), user_id) for service in services
+    ))
+    return APIJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "http_status_code": status.HTTP_200_OK,
+            "message": "Batch Verification Completed",
+            "result": dict(zip(services, results))
+        }
+    )
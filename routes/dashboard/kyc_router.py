@@ -1,14 +1,12 @@
 # Standard library imports
-from typing import Union
-import json
+from typing import Annotated, Tuple
 
 # Third-party library imports
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
 
 # Local application imports
-from dependencies.logger import logger
-from dependencies.exceptions import InsufficientCreditsException
+from dependencies.responses import APIJSONResponse, kyc_response
 
 from dto.kyc_dto import (PassportVerificationRequest, AadhaarVerificationRequest, MobileLookupVerificationRequest,
                          EmailLookupVerificationRequest, VoterVerificationRequest, DLVerificationRequest,
@@ -30,14 +28,37 @@ from handlers.gstin_handler import GSTINHandler
 
 from models.user_model import User as UserModel
 
-kyc_router = APIRouter(prefix="/dashboard/api/v1", tags=["KYC Verification API"])
-
-
-@kyc_router.post("/pan/verify", response_model=APISuccessResponse)
-def verify_pan(
+kyc_router = APIRouter(
+    prefix="/dashboard/api/v1",
+    tags=["KYC Verification API"],
+    default_response_class=APIJSONResponse
+)
+
+# Documents the success payload in OpenAPI without response-model validation at runtime
+_SUCCESS_RESPONSE_DOC = {200: {"model": APISuccessResponse}}
+
+# Authenticated, active dashboard user
+CurrentUser = Annotated[UserModel, Depends(AuthHandler.get_current_active_user)]
+
+# Handlers hold no per-request state, so one instance of each is shared
+_pan_handler = PanHandler()
+_rc_handler = RCHandler()
+_voter_handler = VoterHandler()
+_dl_handler = DLHandler()
+_passport_handler = PassportHandler()
+_aadhaar_handler = AadhaarHandler()
+_mobile_lookup_handler = MobileLookupHandler()
+_email_lookup_handler = EmailLookupHandler()
+_employment_latest_handler = EmploymentLatestHandler()
+_gstin_handler = GSTINHandler()
+
+
+@kyc_router.post("/pan/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("PAN")
+async def verify_pan(
     request: PanVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentUser
+) -> Tuple[dict, int]:
     """
     Verify PAN details.
 
@@ -46,47 +67,20 @@ def verify_pan(
         user: Authenticated user
 
     Returns:
-        PanVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        pan_verification_response, http_status_code = PanHandler().get_pan_kyc_details(
-            pan=request.pan, user_id=str(user.id)
-        )
-        logger.info(f"PAN Verification Response: {pan_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": pan_verification_response.get('message')
-                }
-            )
-
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="PAN Verification Successful",
-            result=pan_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_pan: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
-
-
-@kyc_router.post("/rc/verify", response_model=APISuccessResponse)
-def verify_vehicle(
+    return await run_in_threadpool(
+        _pan_handler.get_pan_kyc_details,
+        pan=request.pan, user_id=str(user.id)
+    )
+
+
+@kyc_router.post("/rc/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("RC", allow_partial_content=True)
+async def verify_vehicle(
     request: VehicleVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentUser
+) -> Tuple[dict, int]:
     """
     Verify RC details.
 
@@ -95,56 +89,20 @@ def verify_vehicle(
         user: Authenticated user
 
     Returns:
-        VehicleVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        rc_verification_response, http_status_code = RCHandler().get_rc_kyc_details(
-            reg_no=request.reg_no, user_id=str(user.id)
-        )
-        logger.info(f"RC Verification Response: {rc_verification_response}")
-        if http_status_code == status.HTTP_206_PARTIAL_CONTENT:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "RC Verification Successful",
-                    "result": rc_verification_response.get('message')
-                }
-            )
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": rc_verification_response.get('message')
-                }
-            )
-
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="RC Verification Successful",
-            result=rc_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_vehicle: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
-
-
-@kyc_router.post("/voter/verify", response_model=APISuccessResponse)
-def verify_voter(
+    return await run_in_threadpool(
+        _rc_handler.get_rc_kyc_details,
+        reg_no=request.reg_no, user_id=str(user.id)
+    )
+
+
+@kyc_router.post("/voter/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("VOTER")
+async def verify_voter(
     request: VoterVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentUser
+) -> Tuple[dict, int]:
     """
     Verify voter details.
 
@@ -153,47 +111,20 @@ def verify_voter(
         user: Authenticated user
 
     Returns:
-        VehicleVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        voter_verification_response, http_status_code = VoterHandler().get_voter_kyc_details(
-            epic_no=request.epic_no, user_id=str(user.id)
-        )
-        logger.info(f"VOTER Verification Response: {voter_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": voter_verification_response.get('message')
-                }
-            )
-
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="VOTER Verification Successful",
-            result=voter_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_voter: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
-
-
-@kyc_router.post("/dl/verify", response_model=APISuccessResponse)
-def verify_dl(
+    return await run_in_threadpool(
+        _voter_handler.get_voter_kyc_details,
+        epic_no=request.epic_no, user_id=str(user.id)
+    )
+
+
+@kyc_router.post("/dl/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("DL")
+async def verify_dl(
     request: DLVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentUser
+) -> Tuple[dict, int]:
     """
     Verify DL details.
 
@@ -202,49 +133,22 @@ def verify_dl(
         user: Authenticated user
 
     Returns:
-        DLVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        dl_verification_response, http_status_code = DLHandler().get_dl_kyc_details(
-            dl_no=request.dl_no,
-            dob=request.dob,
-            user_id=str(user.id)
-        )
-        dl_verification_response = json.loads(json.dumps(dl_verification_response))
-        logger.info(f"DL Verification Response: {dl_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": dl_verification_response.get('message')
-                }
-            )
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="DL Verification Successful",
-            result=dl_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_passport: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
-
-
-@kyc_router.post("/passport/verify", response_model=APISuccessResponse)
-def verify_passport(
+    return await run_in_threadpool(
+        _dl_handler.get_dl_kyc_details,
+        dl_no=request.dl_no,
+        dob=request.dob,
+        user_id=str(user.id)
+    )
+
+
+@kyc_router.post("/passport/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("PASSPORT")
+async def verify_passport(
     request: PassportVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentUser
+) -> Tuple[dict, int]:
     """
     Verify passport details.
 
@@ -253,50 +157,23 @@ def verify_passport(
         user: Authenticated user
 
     Returns:
-        PassportVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        passport_verification_response, http_status_code = PassportHandler().get_passport_kyc_details(
-            file_number=request.file_number,
-            dob=request.dob,
-            name=request.name,
-            user_id=str(user.id)
-        )
-        logger.info(f"PASSPORT Verification Response: {passport_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": passport_verification_response.get('message')
-                }
-            )
-
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="PASSPORT Verification Successful",
-            result=passport_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_passport: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
-
-
-@kyc_router.post("/aadhaar/verify", response_model=APISuccessResponse)
-def verify_aadhaar(
+    return await run_in_threadpool(
+        _passport_handler.get_passport_kyc_details,
+        file_number=request.file_number,
+        dob=request.dob,
+        name=request.name,
+        user_id=str(user.id)
+    )
+
+
+@kyc_router.post("/aadhaar/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("AADHAAR")
+async def verify_aadhaar(
     request: AadhaarVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentUser
+) -> Tuple[dict, int]:
     """
     Verify Aadhaar details.
 
@@ -305,47 +182,20 @@ def verify_aadhaar(
         user: Authenticated user
 
     Returns:
-        AadhaarVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        aadhaar_verification_response, http_status_code = AadhaarHandler().get_aadhaar_kyc_details(
-            aadhaar=request.aadhaar, user_id=str(user.id)
-        )
-        logger.info(f"AADHAAR Verification Response: {aadhaar_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": aadhaar_verification_response.get('message')
-                }
-            )
-
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="AADHAAR Verification Successful",
-            result=aadhaar_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_aadhaar: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
-
-
-@kyc_router.post("/mobile-lookup/verify", response_model=APISuccessResponse)
-def verify_mobile(
+    return await run_in_threadpool(
+        _aadhaar_handler.get_aadhaar_kyc_details,
+        aadhaar=request.aadhaar, user_id=str(user.id)
+    )
+
+
+@kyc_router.post("/mobile-lookup/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("MOBILE LOOKUP")
+async def verify_mobile(
     request: MobileLookupVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentUser
+) -> Tuple[dict, int]:
     """
     Verify mobile details.
 
@@ -354,47 +204,20 @@ def verify_mobile(
         user: Authenticated user
 
     Returns:
-        MobileLookupVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        mobile_lookup_verification_response, http_status_code = MobileLookupHandler().get_mobile_lookup_kyc_details(
-            mobile=request.mobile, user_id=str(user.id)
-        )
-        logger.info(f"MOBILE LOOKUP Verification Response: {mobile_lookup_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": mobile_lookup_verification_response.get('message')
-                }
-            )
-
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="MOBILE LOOKUP Verification Successful",
-            result=mobile_lookup_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_mobile: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
-
-
-@kyc_router.post("/email-lookup/verify", response_model=APISuccessResponse)
-def verify_email(
+    return await run_in_threadpool(
+        _mobile_lookup_handler.get_mobile_lookup_kyc_details,
+        mobile=request.mobile, user_id=str(user.id)
+    )
+
+
+@kyc_router.post("/email-lookup/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("EMAIL LOOKUP")
+async def verify_email(
     request: EmailLookupVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentUser
+) -> Tuple[dict, int]:
     """
     Verify email details.
 
@@ -403,47 +226,20 @@ def verify_email(
         user: Authenticated user
 
     Returns:
-        EmailLookupVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        email_lookup_verification_response, http_status_code = EmailLookupHandler().get_email_lookup_kyc_details(
-            email=request.email, user_id=str(user.id)
-        )
-        logger.info(f"EMAIL LOOKUP Verification Response: {email_lookup_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": email_lookup_verification_response.get('message')
-                }
-            )
-
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="EMAIL LOOKUP Verification Successful",
-            result=email_lookup_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_email: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
-
-
-@kyc_router.post("/employment-latest/verify", response_model=APISuccessResponse)
-def verify_employment_latest(
+    return await run_in_threadpool(
+        _email_lookup_handler.get_email_lookup_kyc_details,
+        email=request.email, user_id=str(user.id)
+    )
+
+
+@kyc_router.post("/employment-latest/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("EMPLOYMENT LATEST")
+async def verify_employment_latest(
     request: EmploymentLatestVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentUser
+) -> Tuple[dict, int]:
     """
     Verify employment latest details.
 
@@ -452,55 +248,26 @@ def verify_employment_latest(
         user: Authenticated user
 
     Returns:
-        EmploymentLatestVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        employment_latest_verification_response, http_status_code = (
-            EmploymentLatestHandler().get_employment_latest_details(
-                uan=request.uan,
-                pan=request.pan,
-                mobile=request.mobile,
-                dob=request.dob,
-                employer_name=request.employer_name,
-                employee_name=request.employee_name,
-                user_id=str(user.id)
-            )
-        )
-        logger.info(f"EMPLOYMENT LATEST Verification Response: {employment_latest_verification_response}")
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": employment_latest_verification_response.get('message')
-                }
-            )
-
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="EMPLOYMENT LATEST Verification Successful",
-            result=employment_latest_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_employment_latest: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
-
-
-@kyc_router.post("/gstin/verify", response_model=APISuccessResponse)
-def verify_gstin(
+    return await run_in_threadpool(
+        _employment_latest_handler.get_employment_latest_details,
+        uan=request.uan,
+        pan=request.pan,
+        mobile=request.mobile,
+        dob=request.dob,
+        employer_name=request.employer_name,
+        employee_name=request.employee_name,
+        user_id=str(user.id)
+    )
+
+
+@kyc_router.post("/gstin/verify", responses=_SUCCESS_RESPONSE_DOC)
+@kyc_response("GSTIN")
+async def verify_gstin(
     request: GSTINVerificationRequest,
-    user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> Union[APISuccessResponse, JSONResponse]:
+    user: CurrentUser
+) -> Tuple[dict, int]:
     """
     Verify gstin details.
 
@@ -509,38 +276,9 @@ def verify_gstin(
         user: Authenticated user
 
     Returns:
-        GSTINVerificationResponse or JSONResponse for error cases
+        Tuple[dict, int]: Handler verification response and HTTP status code
     """
-    try:
-        gstin_verification_response, http_status_code = GSTINHandler().get_gstin_kyc_details(
-            gstin=request.gstin, user_id=str(user.id)
-        )
-        logger.info(f"GSTIN Verification Response: {gstin_verification_response}")
-        gstin_verification_response = json.loads(json.dumps(gstin_verification_response))
-
-        if http_status_code != status.HTTP_200_OK:
-            return JSONResponse(
-                status_code=http_status_code,
-                content={
-                    "http_status_code": http_status_code,
-                    "message": "Failure",
-                    "error": gstin_verification_response.get('message')
-                }
-            )
-
-        return APISuccessResponse(
-            http_status_code=http_status_code,
-            message="GSTIN Verification Successful",
-            result=gstin_verification_response,
-        )
-    except InsufficientCreditsException as e:
-        return JSONResponse(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            content={"message": str(e.detail)}
-        )
-    except Exception as e:
-        logger.error(f"Error in verify_gstin: {str(e)}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"message": str(e)}
-        )
+    return await run_in_threadpool(
+        _gstin_handler.get_gstin_kyc_details,
+        gstin=request.gstin, user_id=str(user.id)
+    )
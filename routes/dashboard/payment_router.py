@@ -1,12 +1,15 @@
 # Standard library imports
-from typing import Dict, Any, Optional
+from typing import Annotated, Dict, Any, Optional
 
 # Third-party library imports
 import razorpay
-from fastapi import APIRouter, Depends, HTTPException, responses
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, responses
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
 # Local application imports
-from handlers.payment_handler import PaymentHandler
+from handlers.payment_handler import PaymentHandler, SUCCESSFUL_PAYMENT_LINK_STATUSES
 from handlers.auth_handlers import AuthHandler
 
 from models.user_model import User as UserModel
@@ -19,16 +22,28 @@ from dto.payment_dto import (
 
 from dependencies.logger import logger
 from dependencies.configuration import AppConfiguration
+from dependencies.responses import APIJSONResponse
 
 # Create router
-payment_router = APIRouter(prefix="/dashboard/api/v1/payments", tags=["payments"])
+payment_router = APIRouter(
+    prefix="/dashboard/api/v1/payments",
+    tags=["payments"],
+    default_response_class=APIJSONResponse
+)
+
+# Authenticated, active dashboard user
+CurrentUser = Annotated[UserModel, Depends(AuthHandler.get_current_active_user)]
+
+# Frontend pages the payment callback redirects to
+_SUCCESS_URL = f"{AppConfiguration.FRONTEND_BASE_URL}/#/success-payment"
+_FAILURE_URL = f"{AppConfiguration.FRONTEND_BASE_URL}/#/failure-payment"
 
 
-@payment_router.post("/create", response_model=PaymentLinkResponse)
+@payment_router.post("/create", responses={200: {"model": PaymentLinkResponse}})
 def create_payment_link(
     request: PaymentLinkRequest,
-    current_user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> PaymentLinkResponse:
+    current_user: CurrentUser
+) -> APIJSONResponse:
     """
     Create a payment link for purchasing credits.
 
@@ -37,18 +52,18 @@ def create_payment_link(
         current_user: Authenticated user
 
     Returns:
-        PaymentLinkResponse: Payment link details
+        APIJSONResponse: Payment link details in the PaymentLinkResponse schema
     """
     try:
         reference_id, response = PaymentHandler.create_payment_link(request, current_user)
 
-        return PaymentLinkResponse(
-            order_id=reference_id,
-            short_url=response.get("short_url"),
-            amount=request.amount,
-            credits_purchased=request.credits_purchased,
-            status="pending"
-        )
+        return APIJSONResponse(content={
+            "order_id": reference_id,
+            "short_url": response.get("short_url"),
+            "amount": request.amount,
+            "credits_purchased": request.credits_purchased,
+            "status": "pending"
+        })
     except razorpay.errors.BadRequestError as e:
         # Handle Razorpay-specific errors
         logger.error(f"Razorpay BadRequestError: {str(e)}")
@@ -73,20 +88,18 @@ def verify_payment(
     Returns:
         RedirectResponse: Redirect to success or failure page
     """
+    # Canceled or failed payments, per the status from Razorpay, go straight to the failure page
+    if (razorpay_payment_link_status and
+            razorpay_payment_link_status.lower() not in SUCCESSFUL_PAYMENT_LINK_STATUSES):
+        logger.warning("Payment %s was not successful, status %s; redirecting to %s",
+                       razorpay_payment_id, razorpay_payment_link_status, _FAILURE_URL)
+        return responses.RedirectResponse(url=_FAILURE_URL, status_code=303)
+
     try:
-        logger.info(f"CALLBACK RECEIVED: payment_id={razorpay_payment_id}, link_id={razorpay_payment_link_id}")
-        logger.info(f"Payment status from Razorpay: {razorpay_payment_link_status}")
-        logger.info(f"Payment signature: {razorpay_signature}")
-        logger.info(f"Payment link reference ID: {razorpay_payment_link_reference_id}")
-
-        # Check if payment was canceled or failed based on status from Razorpay
-        if (razorpay_payment_link_status and
-                razorpay_payment_link_status.lower() not in ["paid", "authorized", "captured"]):
-            logger.warning(f"Payment was not successful. Status: {razorpay_payment_link_status}")
-            # Redirect to a failure page
-            redirect_url = f"{AppConfiguration.FRONTEND_BASE_URL}/#/failure-payment"
-            logger.info(f"Redirecting to failure page: {redirect_url}")
-            return responses.RedirectResponse(url=redirect_url, status_code=303)
+        logger.info("CALLBACK RECEIVED: payment_id=%s, link_id=%s, reference_id=%s, status=%s",
+                    razorpay_payment_id, razorpay_payment_link_id,
+                    razorpay_payment_link_reference_id, razorpay_payment_link_status)
+        logger.debug("Payment signature: %s", razorpay_signature)
 
         # Get the verification response directly from the handler
         response = PaymentHandler.verify_payment(
@@ -97,32 +110,18 @@ def verify_payment(
             razorpay_payment_link_status=razorpay_payment_link_status
         )
 
-        logger.info(f"VERIFICATION RESULT: {response}")
-
         # Determine the redirect URL based on the verification result
-        if response.success:  # Check the 'success' field
-            # Redirect to a success page
-            logger.info(f"VERIFICATION RESULT: {response}")
-            redirect_url = f"{AppConfiguration.FRONTEND_BASE_URL}/#/success-payment"
-            logger.info(f"Redirecting to success page: {redirect_url}")
-        else:
-            # Redirect to a failure page
-            logger.info(f"VERIFICATION RESULT: {response}")
-            redirect_url = f"{AppConfiguration.FRONTEND_BASE_URL}/#/failure-payment"
-            logger.info(f"Redirecting to failure page: {redirect_url}")
+        redirect_url = _SUCCESS_URL if response.success else _FAILURE_URL
+        logger.info("VERIFICATION RESULT: %s; redirecting to %s", response, redirect_url)
 
         # Perform the redirect
         return responses.RedirectResponse(url=redirect_url, status_code=303)
     except razorpay.errors.BadRequestError as e:
-        logger.error(f"Razorpay BadRequestError: {str(e)}")
-        redirect_url = f"{AppConfiguration.FRONTEND_BASE_URL}/#/failure-payment"
-        return responses.RedirectResponse(url=redirect_url, status_code=303)
+        logger.error("Razorpay BadRequestError: %s", e)
+        return responses.RedirectResponse(url=_FAILURE_URL, status_code=303)
     except Exception as e:
-        logger.error(f"Error verifying payment: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
-        redirect_url = f"{AppConfiguration.FRONTEND_BASE_URL}/#/failure-payment"
-        return responses.RedirectResponse(url=redirect_url, status_code=303)
+        logger.exception("Error verifying payment: %s", e)
+        return responses.RedirectResponse(url=_FAILURE_URL, status_code=303)
 
 
 @payment_router.post("/manual-verify/{payment_link_id}")
@@ -139,12 +138,12 @@ def manual_verify_payment(
         Dict[str, Any]: Result of the manual verification
     """
     try:
-        logger.info(f"Manual verification for payment link ID: {payment_link_id}")
+        logger.info("Manual verification for payment link ID: %s", payment_link_id)
 
         result = PaymentHandler.manual_verify_payment(payment_link_id)
 
         if not result["success"]:
-            logger.error(f"Manual verification failed: {result.get('message')}")
+            logger.error("Manual verification failed: %s", result.get('message'))
             raise HTTPException(status_code=400, detail=result.get('message'))
 
         return result
@@ -152,24 +151,57 @@ def manual_verify_payment(
         # Re-raise FastAPI HTTP exceptions
         raise e
     except Exception as e:
-        logger.error(f"Error in manual verification: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception("Error in manual verification: %s", e)
         raise HTTPException(status_code=500, detail=f"Manual verification failed: {str(e)}")
 
 
-@payment_router.post("/webhook", response_model=Dict[str, Any])
-def handle_webhook(request: PaymentWebhookRequest) -> Dict[str, Any]:
+@payment_router.post(
+    "/webhook",
+    response_model=Dict[str, Any],
+    openapi_extra={"requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": PaymentWebhookRequest.model_json_schema()}}
+    }}
+)
+async def handle_webhook(
+    raw_request: Request,
+    x_razorpay_signature: Optional[str] = Header(None),
+    x_razorpay_event_id: Optional[str] = Header(None)
+) -> Dict[str, Any]:
     """
     Handle webhook events from Razorpay.
 
+    The signature is checked against the raw body before it is parsed, so it
+    covers the payload exactly as Razorpay sent it.
+
+    Args:
+        raw_request: Incoming request carrying the webhook payload
+        x_razorpay_signature: HMAC-SHA256 signature of the raw body
+        x_razorpay_event_id: Razorpay event ID, identical across retries of a delivery
+
     Returns:
         Dict[str, Any]: Result of the webhook processing
+
+    Raises:
+        HTTPException: 400 if the webhook signature does not match
+        RequestValidationError: If the body is not a valid webhook payload
     """
+    body = await raw_request.body()
+    if not PaymentHandler.verify_webhook_signature(body, x_razorpay_signature):
+        logger.warning("Rejecting webhook event %s with an invalid signature", x_razorpay_event_id)
+        raise HTTPException(status_code=400, detail="Invalid webhook signature")
+
+    try:
+        request = PaymentWebhookRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
     try:
         logger.info(f"Received webhook event: {request.event}")
 
-        result = PaymentHandler.handle_webhook(request)
+        result = await run_in_threadpool(PaymentHandler.handle_webhook, request, x_razorpay_event_id)
 
         if result.get("status") != "success":
             logger.error(f"Webhook processing failed: {result.get('message')}")
@@ -178,9 +210,7 @@ def handle_webhook(request: PaymentWebhookRequest) -> Dict[str, Any]:
 
         return result
     except Exception as e:
-        logger.error(f"Error processing webhook: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception("Error processing webhook: %s", e)
         # Return a 200 status even on error to acknowledge receipt to Razorpay
         # but include error details in the response
         return {"status": "error", "message": f"Webhook processing failed: {str(e)}"}
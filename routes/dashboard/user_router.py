@@ -1,12 +1,13 @@
 # Standard library imports
-from typing import Any
+from typing import Annotated, Any
 
 # Third-party library imports
-from fastapi import APIRouter, Depends, status, security, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, status, security, HTTPException
 
 # Local application imports
 from dependencies.exceptions import UserNotFoundException
 from dependencies.logger import logger
+from dependencies.responses import APIJSONResponse
 
 from dto.user_dto import (
     Token,
@@ -15,13 +16,14 @@ from dto.user_dto import (
     User,
     UserCreate,
     UserUpdate,
+    VerifiedUserCreate,
     RefreshTokenRequest,
     UserOTPCreate,
     UserVerifyResponse,
     UserVerifyRequest,
     PasswordResetRequest
 )
-from dto.common_dto import APISuccessResponse
+from dto.common_dto import APISuccessResponse, SuccessPayload
 
 from handlers.auth_handlers import AuthHandler
 from handlers.dashboard_handler import DashboardHandler
@@ -32,6 +34,16 @@ from models.user_model import User as UserModel
 # Create a single router for all routes
 auth_router = APIRouter(prefix="/dashboard/api/v1")
 
+# Documents the success payload in OpenAPI without response-model validation at runtime
+_SUCCESS_RESPONSE_DOC = {200: {"model": APISuccessResponse}}
+
+# Authenticated, active dashboard user
+CurrentUser = Annotated[UserModel, Depends(AuthHandler.get_current_active_user)]
+
+# Handlers hold no per-request state, so one instance of each is shared
+_dashboard_handler = DashboardHandler()
+_ledger_handler = UserLedgerTransactionHandler()
+
 # Auth Routes
 
 
@@ -112,12 +124,47 @@ def register(user_data: UserCreate) -> User:
         )
 
 
+@auth_router.post(
+    "/auth/register_verified", response_model=User, status_code=status.HTTP_201_CREATED, tags=["Auth"]
+)
+def register_verified(user_data: VerifiedUserCreate) -> User:
+    """
+    Verify the email OTP and register a new user in one request.
+
+    Replaces the verify_otp then register sequence for clients that already
+    hold the OTP; both endpoints remain available.
+
+    Args:
+        user_data: User creation request containing user details and the OTP sent to the email.
+
+    Returns:
+        User: Details of the newly registered user.
+
+    Raises:
+        HTTPException:
+            - 400: If the OTP is invalid or the email, username or phone number is already registered
+            - 429: If too many verification attempts were made for the email
+            - 500: If there's an error registering the user
+    """
+    AuthHandler.check_otp_rate_limit("verify_email", user_data.email)
+    try:
+        return AuthHandler.register_verified_user(user_data)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.exception(f"Error registering verified user: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to register new user: {str(e)}"
+        )
+
+
 # User Routes
 
 
 @auth_router.get("/users/me", response_model=User, tags=["Fetch Users"])
-def read_users_me(
-    current_user: UserModel = Depends(AuthHandler.get_current_active_user)
+async def read_users_me(
+    current_user: CurrentUser
 ) -> Any:
     """
     Get details of the currently authenticated user.
@@ -134,7 +181,7 @@ def read_users_me(
 @auth_router.put("/users/me", response_model=User, tags=["Fetch Users"])
 def update_user_me(
     user_data: UserUpdate,
-    current_user: UserModel = Depends(AuthHandler.get_current_active_user)
+    current_user: CurrentUser
 ) -> Any:
     """
     Update details of the currently authenticated user.
@@ -151,10 +198,10 @@ def update_user_me(
 # Dashboard Routes
 
 
-@auth_router.get("/summary/fetch", response_model=APISuccessResponse, tags=["Dashboard"])
+@auth_router.get("/summary/fetch", responses=_SUCCESS_RESPONSE_DOC, tags=["Dashboard"])
 def get_summary(
-    current_user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> APISuccessResponse:
+    current_user: CurrentUser
+) -> APIJSONResponse:
     """
     Get summarized count of all services used by the user in the last 30 days.
 
@@ -162,18 +209,18 @@ def get_summary(
         current_user: Authenticated user.
 
     Returns:
-        APISuccessResponse: Response containing service usage summary.
+        APIJSONResponse: Response containing service usage summary, in the APISuccessResponse schema.
 
     Raises:
         HTTPException: If there's an error fetching the summary.
     """
     try:
-        result = DashboardHandler().get_user_summarized_count(str(current_user.id))
-        return APISuccessResponse(
+        result = _dashboard_handler.get_user_summarized_count(str(current_user.id))
+        return APIJSONResponse(SuccessPayload(
             http_status_code=status.HTTP_200_OK,
             message="Successfully retrieved service usage summary",
             result=result
-        )
+        ))
     except Exception:
         logger.exception(f"Error fetching service usage summary for user {current_user.id}")
         raise HTTPException(
@@ -183,10 +230,10 @@ def get_summary(
         )
 
 
-@auth_router.get("/pending-credits/fetch", response_model=APISuccessResponse, tags=["Dashboard"])
+@auth_router.get("/pending-credits/fetch", responses=_SUCCESS_RESPONSE_DOC, tags=["Dashboard"])
 def get_pending_credits(
-    current_user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> APISuccessResponse:
+    current_user: CurrentUser
+) -> APIJSONResponse:
     """
     Get total pending credits for the user.
 
@@ -194,18 +241,18 @@ def get_pending_credits(
         current_user: Authenticated user.
 
     Returns:
-        APISuccessResponse: Response containing pending credits information.
+        APIJSONResponse: Response containing pending credits information, in the APISuccessResponse schema.
 
     Raises:
         HTTPException: If there's an error fetching pending credits.
     """
     try:
-        result = DashboardHandler().get_user_pending_credits(str(current_user.id))
-        return APISuccessResponse(
+        result = _dashboard_handler.get_user_pending_credits(str(current_user.id))
+        return APIJSONResponse(SuccessPayload(
             http_status_code=status.HTTP_200_OK,
             message="Successfully retrieved pending credits",
             result={"pending_credits": result}
-        )
+        ))
     except Exception:
         logger.exception(f"Error fetching pending credits for user {current_user.id}")
         raise HTTPException(
@@ -215,11 +262,11 @@ def get_pending_credits(
         )
 
 
-@auth_router.get("/weekly-stats/fetch/{service_name}", response_model=APISuccessResponse, tags=["Dashboard"])
+@auth_router.get("/weekly-stats/fetch/{service_name}", responses=_SUCCESS_RESPONSE_DOC, tags=["Dashboard"])
 def get_weekly_stats(
     service_name: str,
-    current_user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> APISuccessResponse:
+    current_user: CurrentUser
+) -> APIJSONResponse:
     """
     Get weekly statistics for a specific service used by the user.
 
@@ -229,18 +276,18 @@ def get_weekly_stats(
         current_user: Authenticated user.
 
     Returns:
-        APISuccessResponse: Response containing weekly statistics.
+        APIJSONResponse: Response containing weekly statistics, in the APISuccessResponse schema.
 
     Raises:
         HTTPException: If there's an error fetching weekly statistics.
     """
     try:
-        result = DashboardHandler().get_user_weekly_statistics(str(current_user.id), service_name)
-        return APISuccessResponse(
+        result = _dashboard_handler.get_user_weekly_statistics(str(current_user.id), service_name)
+        return APIJSONResponse(SuccessPayload(
             http_status_code=status.HTTP_200_OK,
             message=f"Successfully retrieved weekly statistics for {service_name}",
             result=result
-        )
+        ))
     except Exception:
         logger.exception(f"Error fetching weekly statistics for user {current_user.id} and service {service_name}")
         raise HTTPException(
@@ -250,10 +297,10 @@ def get_weekly_stats(
         )
 
 
-@auth_router.get("/monthly-stats/fetch", response_model=APISuccessResponse, tags=["Dashboard"])
+@auth_router.get("/monthly-stats/fetch", responses=_SUCCESS_RESPONSE_DOC, tags=["Dashboard"])
 def get_monthly_stats(
-    current_user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> APISuccessResponse:
+    current_user: CurrentUser
+) -> APIJSONResponse:
     """
     Get monthly statistics for a specific service used by the user.
 
@@ -263,18 +310,18 @@ def get_monthly_stats(
         current_user: Authenticated user.
 
     Returns:
-        APISuccessResponse: Response containing monthly statistics.
+        APIJSONResponse: Response containing monthly statistics, in the APISuccessResponse schema.
 
     Raises:
         HTTPException: If there's an error fetching monthly statistics.
     """
     try:
-        result = DashboardHandler().get_user_monthly_statistics(str(current_user.id))
-        return APISuccessResponse(
+        result = _dashboard_handler.get_user_monthly_statistics(str(current_user.id))
+        return APIJSONResponse(SuccessPayload(
             http_status_code=status.HTTP_200_OK,
             message="Successfully retrieved credits usage summary",
             result=result
-        )
+        ))
     except Exception:
         logger.exception(f"Error fetching monthly statistics for user {current_user.id}")
         raise HTTPException(
@@ -284,37 +331,37 @@ def get_monthly_stats(
         )
 
 
-@auth_router.get("/ledger-history/fetch", response_model=APISuccessResponse, tags=["Dashboard"])
+@auth_router.get("/ledger-history/fetch", responses=_SUCCESS_RESPONSE_DOC, tags=["Dashboard"])
 def get_ledger_history(
-    page: int = 1,
-    current_user: UserModel = Depends(AuthHandler.get_current_active_user)
-) -> APISuccessResponse:
+    current_user: CurrentUser,
+    page: int = 1
+) -> APIJSONResponse:
     """
     Get ledger history for the user.
 
     Args:
-        page: Page number to get. (Each page contains 100 transactions)
         current_user: Authenticated user.
+        page: Page number to get. (Each page contains 100 transactions)
 
     Returns:
-        APISuccessResponse: Response containing ledger history.
+        APIJSONResponse: Response containing ledger history, in the APISuccessResponse schema.
 
     Raises:
         HTTPException: If there's an error fetching ledger history.
     """
     try:
-        result, total_transactions = UserLedgerTransactionHandler().get_user_ledger_transactions(
+        result, total_transactions = _ledger_handler.get_user_ledger_transactions(
             str(current_user.id),
             page
         )
-        return APISuccessResponse(
+        return APIJSONResponse(SuccessPayload(
             http_status_code=status.HTTP_200_OK,
             message="Successfully retrieved ledger history",
             result={
                 "ledger_transactions": result,
                 "total_transactions": total_transactions
             }
-        )
+        ))
     except Exception:
         logger.exception(f"Error fetching ledger history for user {current_user.id}")
         raise HTTPException(
@@ -325,13 +372,18 @@ def get_ledger_history(
 
 
 @auth_router.post("/auth/send_otp", response_model=UserVerifyResponse, tags=["Auth"])
-def send_otp(user: UserOTPCreate):
+def send_otp(user: UserOTPCreate, background_tasks: BackgroundTasks, request: Request):
     """
     Send OTP (One-Time Password) to the user's email address for verification.
 
+    The email is sent after the response has been returned. Requests are
+    rate limited per email address and per client IP.
+
     Args:
         user (UserOTPCreate): User data containing email and phone number
                              Example: {"email": "user@example.com", "phone_number": "+1234567890"}
+        background_tasks (BackgroundTasks): Tasks the OTP email is queued on
+        request (Request): The incoming request, used for the client IP
 
     Returns:
         UserVerifyResponse: Response containing email, verification status, and phone number
@@ -345,12 +397,16 @@ def send_otp(user: UserOTPCreate):
         HTTPException:
             - 500: If there's an error sending the OTP
             - 400: If the email or phone number is invalid
+            - 429: If too many OTPs were requested for the email or from the client IP
     """
     logger.info(
         f"Received request with email: {user.email}, phone_number: {user.phone_number}"
     )
+    if request.client is not None:
+        AuthHandler.check_otp_rate_limit("send_ip", request.client.host)
+    AuthHandler.check_otp_rate_limit("send_email", user.email)
     try:
-        AuthHandler.send_otp(user.email, user.phone_number)
+        AuthHandler.send_otp(user.email, user.phone_number, background_tasks)
         response_body = {
             "email": user.email,
             "is_email_verified": False,
@@ -389,8 +445,10 @@ def verify_otp(user: UserVerifyRequest):
         HTTPException:
             - 400: If the OTP is invalid
             - 500: If there's an error verifying the OTP
+            - 429: If too many verification attempts were made for the email
     """
     logger.info(f"Received request with email: {user.email}, otp: {user.otp}")
+    AuthHandler.check_otp_rate_limit("verify_email", user.email)
     try:
         is_email_verified = AuthHandler.verify_otp(user.email, user.otp)
         if not is_email_verified:
@@ -411,10 +469,12 @@ def verify_otp(user: UserVerifyRequest):
 
 
 @auth_router.post("/contact-us/capture", response_model=APISuccessResponse, tags=["Dashboard"])
-def capture_contact_us_lead(lead_data: ContactUsLead):
+def capture_contact_us_lead(lead_data: ContactUsLead, background_tasks: BackgroundTasks):
     """
     Capture and process a contact form submission from potential leads.
 
+    The notification email is sent after the response has been returned.
+
     Args:
         lead_data (ContactUsLead): Contact form data containing name, email, company, phone, and message
                                   Example: {
@@ -424,6 +484,7 @@ def capture_contact_us_lead(lead_data: ContactUsLead):
                                       "phone": "+1234567890",
                                       "message": "Interested in your services"
                                   }
+        background_tasks (BackgroundTasks): Tasks the notification email is queued on
 
     Returns:
         APISuccessResponse: Response containing success status and result
@@ -439,14 +500,15 @@ def capture_contact_us_lead(lead_data: ContactUsLead):
             - 400: If required fields are missing or invalid
     """
     try:
-        result = DashboardHandler().capture_contact_us_lead(
+        result = _dashboard_handler.capture_contact_us_lead(
             name=lead_data.name,
             lead_email=lead_data.lead_email,
             company=lead_data.company,
             phone=lead_data.phone,
-            message=lead_data.message
+            message=lead_data.message,
+            background_tasks=background_tasks
         )
-        return APISuccessResponse(
+        return APISuccessResponse.model_construct(
             http_status_code=status.HTTP_200_OK,
             message="Successfully captured contact us lead",
             result=result
@@ -478,8 +540,8 @@ def get_password_reset(email: str) -> APISuccessResponse:
         APISuccessResponse: Response containing success status and result
     """
     try:
-        AuthHandler().get_password_reset_link(email)
-        return APISuccessResponse(
+        AuthHandler.get_password_reset_link(email)
+        return APISuccessResponse.model_construct(
             http_status_code=status.HTTP_200_OK,
             message="Successfully got password reset link",
             result={"message": "Password reset link sent to email"}
@@ -508,13 +570,13 @@ def reset_password(request: PasswordResetRequest) -> APISuccessResponse:
     Returns:
         APISuccessResponse: Response containing success status and result
     """
-    result = AuthHandler().reset_password(request.email, request.password)
+    result = AuthHandler.reset_password(request.email, request.password)
     if not result:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to reset password. Please try again."
         )
-    return APISuccessResponse(
+    return APISuccessResponse.model_construct(
         http_status_code=status.HTTP_200_OK,
         message="Successfully reset password",
         result=result
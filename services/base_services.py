@@ -7,15 +7,21 @@ from typing import Dict, Any, Tuple
 # Third-party library imports
 import requests
 import razorpay
+from requests.adapters import HTTPAdapter
 from requests.models import Response
 from fastapi import HTTPException
 
 # Local application imports
 from dependencies.logger import logger
-from dependencies.configuration import RazorpayConfiguration
+from dependencies.configuration import AppConfiguration, RazorpayConfiguration
 
 
 class BaseService(ABC):
+    # Shared Razorpay client, built on first use (see get_razorpay_client)
+    _razorpay_client = None
+    # Shared HTTP session for provider calls, built on first use (see get_http_session)
+    _http_session = None
+
     @staticmethod
     def calculate_tat(start_time: datetime, end_time: datetime) -> float:
         """
@@ -53,7 +59,7 @@ class BaseService(ABC):
 
         logger.info(f"Calling external API: {url}")
         for attempt in range(max_retries):
-            response = requests.post(url, json=payload, headers=headers)
+            response = BaseService.get_http_session().post(url, json=payload, headers=headers)
             if not (500 <= response.status_code < 600):
                 break
             time.sleep(delay)
@@ -62,17 +68,45 @@ class BaseService(ABC):
         tat = BaseService.calculate_tat(start_time, end_time)
         return response, tat
 
+    @staticmethod
+    def get_http_session() -> requests.Session:
+        """
+        Get the HTTP session used for external provider calls.
+
+        The session is created once per process so connections (and TLS sessions)
+        to the KYC providers are kept alive and reused across requests. Its pool
+        keeps up to EXTERNAL_API_POOL_MAXSIZE connections per provider host, so
+        concurrent verifications from the threadpool do not open and discard
+        connections beyond the requests default of 10.
+
+        Returns:
+            requests.Session: Shared HTTP session
+        """
+        if BaseService._http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=AppConfiguration.EXTERNAL_API_POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            BaseService._http_session = session
+        return BaseService._http_session
+
     @staticmethod
     def get_razorpay_client():
         """
         Get a configured Razorpay client.
 
+        The client is created once per process and reused, so its underlying
+        requests.Session keeps connections to the Razorpay API alive between calls.
+
         Returns:
             razorpay.Client: Configured Razorpay client
         """
+        if BaseService._razorpay_client is not None:
+            return BaseService._razorpay_client
         try:
-            return razorpay.Client(auth=(RazorpayConfiguration.RAZORPAY_KEY_ID,
-                                         RazorpayConfiguration.RAZORPAY_KEY_SECRET))
+            BaseService._razorpay_client = razorpay.Client(auth=(RazorpayConfiguration.RAZORPAY_KEY_ID,
+                                                                 RazorpayConfiguration.RAZORPAY_KEY_SECRET))
+            return BaseService._razorpay_client
         except Exception as e:
             logger.error(f"Failed to initialize Razorpay client: {str(e)}")
             raise HTTPException(status_code=500, detail="Payment service unavailable")